@@ -16,12 +16,18 @@ Usage:
 """
 
 import bpy
-import bmesh
 import math
+import random
 import os
 import sys
-import argparse
-from mathutils import Vector, Matrix
+import subprocess
+import contextlib
+import functools
+import hashlib
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import numpy as np
 
 # ============================================================
 #                    BASE RENDER PRESET V1-A
@@ -46,8 +52,13 @@ BASE_CONFIG = {
     },
     # Cycles settings
     "cycles": {
+        "device": "GPU",
         "samples": 96,
+        "use_adaptive_sampling": True,
+        "adaptive_min_samples": 16,
         "noise_threshold": 0.015,
+        # Keep BVH/textures resident across consecutive renders of a template
+        "use_persistent_data": True,
         "denoise": True,
         "denoiser": "OPENIMAGEDENOISE",
         "max_bounces": 6,
@@ -110,10 +121,151 @@ BASE_CONFIG = {
     },
 }
 
+# Preset sections resolved once at import; BASE_CONFIG is never mutated
+_WORLD_CFG = BASE_CONFIG["world"]
+_COLOR_MANAGEMENT_CFG = BASE_CONFIG["color_management"]
+_CYCLES_CFG = BASE_CONFIG["cycles"]
+_CAMERA_CFG = BASE_CONFIG["camera"]
+_LIGHTING_CFG = BASE_CONFIG["lighting"]
+_COMPOSITOR_CFG = BASE_CONFIG["compositor"]
+_OUTPUT_CFG = BASE_CONFIG["output"]
+
+_WORLD_STRENGTH = _WORLD_CFG["strength"]
+_GLARE_MIX = _COMPOSITOR_CFG["glare_mix"]
+
+# (scene.cycles attribute, value) pairs applied by setup_render_settings()
+_CYCLES_SETTINGS = tuple((attr, _CYCLES_CFG[key]) for attr, key in (
+    ("device", "device"),
+    ("samples", "samples"),
+    ("use_denoising", "denoise"),
+    ("denoiser", "denoiser"),
+    ("use_adaptive_sampling", "use_adaptive_sampling"),
+    ("adaptive_min_samples", "adaptive_min_samples"),
+    ("adaptive_threshold", "noise_threshold"),
+    ("max_bounces", "max_bounces"),
+    ("diffuse_bounces", "diffuse_bounces"),
+    ("glossy_bounces", "glossy_bounces"),
+    ("transmission_bounces", "transmission_bounces"),
+    ("volume_bounces", "volume_bounces"),
+    ("transparent_max_bounces", "transparent_max_bounces"),
+    ("sample_clamp_indirect", "clamp_indirect"),
+    ("blur_glossy", "filter_glossy"),
+)) + (("caustics_reflective", False), ("caustics_refractive", False))
+
+# (scene.view_settings attribute, value) pairs applied by setup_render_settings()
+_VIEW_SETTINGS = tuple(
+    (attr, _COLOR_MANAGEMENT_CFG[attr]) for attr in ("view_transform", "look", "exposure", "gamma")
+)
+
 # ============================================================
 #                    HOUSE CONFIGURATIONS
 # ============================================================
 
+class _ConfigMapping:
+    """Dict-style read access for config dataclasses; unset (None) fields read as missing."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+
+@dataclass(slots=True, frozen=True)
+class LightSig(_ConfigMapping):
+    """One entry of a house light_signature."""
+    name: str
+    type: str
+    strength: float
+    color: tuple
+    location: tuple
+    size: object = None
+    rotation: tuple = (0, 0, 0)
+    radius: float = None
+    tube_radius: float = None
+    gradient: bool = False
+    gradient_colors: tuple = ()
+
+    @classmethod
+    def from_dict(cls, light_def):
+        """Build a LightSig from a plain dict, normalizing a scalar size to an (x, y) pair."""
+        size = light_def.get("size")
+        if size is not None and not isinstance(size, tuple):
+            size = (size, size)
+        return cls(**{
+            **light_def,
+            "size": size,
+            "gradient_colors": tuple(light_def.get("gradient_colors", ())),
+        })
+
+
+# Fields that may be written as (low, high) ranges in the HOUSES literals
+_RANGE_FIELDS = ("emission_strength", "orbit_emission_strength", "core_roughness", "metal_roughness")
+
+
+@dataclass(slots=True, frozen=True)
+class HouseCfg(_ConfigMapping):
+    """Immutable per-house configuration."""
+    id: int
+    theme: str
+    core_type: str
+    core_roughness: float
+    light_signature: tuple
+    volume_enabled: bool
+    tint: tuple
+    primary_color: tuple
+    secondary_color: tuple
+    accent_color: tuple
+    emission_color: tuple
+    emission_strength: float
+    # Optional overrides, defaulting to the base preset so builders read attributes directly
+    world_strength: float = _WORLD_STRENGTH
+    key_strength: float = _LIGHTING_CFG["key"]["strength"]
+    fill_strength: float = _LIGHTING_CFG["fill"]["strength"]
+    fill_color: tuple = _LIGHTING_CFG["fill"]["color"]
+    rim_strength: float = _LIGHTING_CFG["rim"]["strength"]
+    rim_color: tuple = _LIGHTING_CFG["rim"]["color"]
+    core_dispersion: float = 0.0
+    core_base_color: tuple = (0.02, 0.02, 0.02)
+    metal_roughness: float = 0.15
+    metal_anisotropic: float = 0.3
+    subsurface_strength: float = 0.08
+    edge_frost: bool = False
+    iridescence_strength: float = 0.15
+    iridescence_shift: float = 0.3
+    fresnel_emission_color: tuple = (1.0, 0.5, 0.2)
+    fresnel_emission_strength: float = 8.0
+    fresnel_ior: float = 2.5
+    fresnel_power: float = 3.0
+    glare_mix: float = _GLARE_MIX
+    volume_density: float = 0.02
+    volume_anisotropy: float = 0.3
+    volume_color: tuple = (1.0, 1.0, 1.0)
+    # Optional overrides whose fallback depends on the call site (None reads as missing)
+    core_ior: float = None
+    core_metallic: float = None
+    metal_color: tuple = None
+    subsurface_color: tuple = None
+    orbit_emission_color: tuple = None
+    orbit_emission_strength: float = None
+
+    @classmethod
+    def from_dict(cls, config):
+        """Build a HouseCfg (and its LightSig entries) from a plain config dict."""
+        lights = tuple(LightSig.from_dict(light_def) for light_def in config.get("light_signature", []))
+        # Templates use the low end of (low, high) ranges
+        ranges = {key: config[key][0] for key in _RANGE_FIELDS if isinstance(config.get(key), tuple)}
+        return cls(**{**config, **ranges, "light_signature": lights})
+
+
 HOUSES = {
     "CLEAR": {
         "id": 1,
@@ -436,6 +588,9 @@ HOUSES = {
     },
 }
 
+# Freeze the editable dict literals into slotted config objects
+HOUSES = {house_name: HouseCfg.from_dict(config) for house_name, config in HOUSES.items()}
+
 
 # ============================================================
 #                    UTILITY FUNCTIONS
@@ -443,28 +598,32 @@ HOUSES = {
 
 def clear_scene():
     """Remove all objects from the scene."""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
-    for block in bpy.data.materials:
-        if block.users == 0:
-            bpy.data.materials.remove(block)
-    for block in bpy.data.lights:
-        if block.users == 0:
-            bpy.data.lights.remove(block)
-    for block in bpy.data.node_groups:
-        if block.users == 0:
-            bpy.data.node_groups.remove(block)
-
-
-def safe_unlink_from_scene(obj):
-    """Safely unlink an object from the scene collection."""
-    scene_collection = bpy.context.scene.collection
-    if obj.name in scene_collection.objects:
-        scene_collection.objects.unlink(obj)
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    _EMISSION_MAT_CACHE.clear()
+    _SHARED_LIGHT_MESHES.clear()
+    _MAT_CACHE.clear()
+    _TEX_CACHE.clear()
+
+    # One C-side pass over all ID types, including datablocks orphaned transitively
+    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+
+
+@contextlib.contextmanager
+def deferred_scene_updates(scene=None):
+    """Build a batch of datablocks without undo pushes and evaluate the depsgraph once at the end."""
+    scene = scene or bpy.context.scene
+    edit_prefs = bpy.context.preferences.edit
+    lock_interface = scene.render.use_lock_interface
+    global_undo = edit_prefs.use_global_undo
+    scene.render.use_lock_interface = True
+    edit_prefs.use_global_undo = False
+    try:
+        yield
+        bpy.context.view_layer.update()
+    finally:
+        scene.render.use_lock_interface = lock_interface
+        edit_prefs.use_global_undo = global_undo
 
 
 def create_collections():
@@ -477,313 +636,600 @@ def create_collections():
     return collections
 
 
+def hex_to_rgb_batch(hex_list):
+    """Convert hex colors to an (N, 3) float32 RGB array."""
+    raw = bytes.fromhex(''.join(h.lstrip('#') for h in hex_list))
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.float32) / 255.0
+
+
 def hex_to_rgb(hex_str):
     """Convert hex color to RGB tuple."""
-    hex_str = hex_str.lstrip('#')
-    return tuple(int(hex_str[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+    return tuple(hex_to_rgb_batch([hex_str])[0].tolist())
+
+
+def gradient_to_arrays(stops):
+    """Split [(position, (r, g, b)), ...] stops into float32 position and (N, 4) RGBA arrays."""
+    positions = np.array([stop[0] for stop in stops], dtype=np.float32)
+    colors = np.ones((len(stops), 4), dtype=np.float32)
+    colors[:, :3] = [stop[1] for stop in stops]
+    return positions, colors
+
+
+def apply_color_ramp(ramp, positions, colors):
+    """Upload sorted ramp stops in bulk, adding elements only when the ramp is short."""
+    elements = ramp.elements
+    for position in positions[len(elements):]:
+        elements.new(float(position))
+    elements.foreach_set("position", positions)
+    elements.foreach_set("color", colors.ravel())
+
+
+# World gradient stops, converted once at import
+_WORLD_GRADIENT = gradient_to_arrays(_WORLD_CFG["gradient_colors"])
 
 
 # ============================================================
 #                    EMISSION PLANE CREATION
 # ============================================================
 
-def create_emission_plane(name, size, strength, color, location, rotation, collections):
-    """Create an emission plane (softbox light)."""
-    bpy.ops.mesh.primitive_plane_add(size=1, location=location)
-    plane = bpy.context.active_object
-    plane.name = name
+# Unit plane (matches primitive_plane_add(size=1)); scaled per light via matrix_world
+_PLANE_VERTS = np.array([(-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0)], dtype=np.float32)
+_PLANE_FACES = np.array([(0, 1, 2, 3)], dtype=np.int32)
+
+# Unit cube (half-size 1, same layout as primitive_cube_add)
+_CUBE_VERTS = np.array([
+    (-1, -1, -1), (-1, -1, 1), (-1, 1, -1), (-1, 1, 1),
+    (1, -1, -1), (1, -1, 1), (1, 1, -1), (1, 1, 1),
+], dtype=np.float32)
+_CUBE_FACES = np.array([
+    (0, 1, 3, 2), (2, 3, 7, 6), (6, 7, 5, 4), (4, 5, 1, 0), (2, 6, 4, 0), (7, 3, 1, 5),
+], dtype=np.int32)
+
+# Packed torus mesh buffers keyed by (radius, tube_radius, major_segments, minor_segments)
+_RING_MESH_TEMPLATES = {}
+
+# Hidden fake-user template materials, one node graph per family, cloned per material
+_MATERIAL_TEMPLATE_PREFIX = ".MAT_Template_"
+
+# Emission materials keyed by (rounded color, rounded strength); reset by clear_scene()
+_EMISSION_MAT_CACHE = {}
+
+# Light and atmosphere meshes shared via linked data, keyed by shape; reset by clear_scene()
+_SHARED_LIGHT_MESHES = {}
+
+
+def _compose_matrices(locations, rotations_rad, scales):
+    """Build (N, 4, 4) world matrices from locations, XYZ Euler radians and XY scales."""
+    rx, ry, rz = np.asarray(rotations_rad).T
+    cx, cy, cz = np.cos(rx), np.cos(ry), np.cos(rz)
+    sx, sy, sz = np.sin(rx), np.sin(ry), np.sin(rz)
+
+    matrices = np.zeros((len(locations), 4, 4), dtype=np.float32)
+    # Blender XYZ Euler order: R = Rz @ Ry @ Rx
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    # Scale the local X/Y axes, then translate
+    matrices[:, :3, 0] *= scales[:, 0:1]
+    matrices[:, :3, 1] *= scales[:, 1:2]
+    matrices[:, :3, 3] = locations
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_torus(major_segments, minor_segments):
+    """Return (ring, tube, loop_verts, loop_starts) so a torus is radius * ring + tube_radius * tube."""
+    u = np.linspace(0.0, 2 * np.pi, major_segments, endpoint=False, dtype=np.float32)
+    v = np.linspace(0.0, 2 * np.pi, minor_segments, endpoint=False, dtype=np.float32)
+
+    # (major, minor) grid: ((R + r cos v) cos u, (R + r cos v) sin u, r sin v)
+    cos_u = np.broadcast_to(np.cos(u)[:, None], (major_segments, minor_segments))
+    sin_u = np.broadcast_to(np.sin(u)[:, None], (major_segments, minor_segments))
+    ring = np.stack((cos_u, sin_u, np.zeros_like(cos_u)), axis=-1).reshape(-1, 3)
+    tube = np.stack((
+        np.cos(v)[None, :] * cos_u,
+        np.cos(v)[None, :] * sin_u,
+        np.broadcast_to(np.sin(v)[None, :], cos_u.shape),
+    ), axis=-1).reshape(-1, 3)
+
+    # One quad per grid cell, wrapping around both loops
+    i = np.arange(major_segments)[:, None]
+    j = np.arange(minor_segments)[None, :]
+    i_next = (i + 1) % major_segments
+    j_next = (j + 1) % minor_segments
+    faces = np.stack((
+        i * minor_segments + j,
+        i_next * minor_segments + j,
+        i_next * minor_segments + j_next,
+        i * minor_segments + j_next,
+    ), axis=-1).reshape(-1, 4).astype(np.int32)
+
+    _, loop_verts, loop_starts = pack_mesh_buffers(ring, faces)
+    return ring, tube, loop_verts, loop_starts
+
+
+def _torus_buffers(radius, tube_radius, major_segments=64, minor_segments=16):
+    """Return cached packed mesh buffers for a torus lying in the XY plane."""
+    key = (radius, tube_radius, major_segments, minor_segments)
+    buffers = _RING_MESH_TEMPLATES.get(key)
+    if buffers is None:
+        ring, tube, loop_verts, loop_starts = _unit_torus(major_segments, minor_segments)
+        verts = np.float32(radius) * ring + np.float32(tube_radius) * tube
+        buffers = (verts, loop_verts, loop_starts)
+        _RING_MESH_TEMPLATES[key] = buffers
+    return buffers
+
+
+def pack_mesh_buffers(verts, *face_blocks):
+    """Pack verts and (F, k) blocks of equal-sized faces into (verts, loop_verts, loop_starts) buffers."""
+    blocks = [np.asarray(block, dtype=np.int32) for block in face_blocks]
+    co = np.ascontiguousarray(verts, dtype=np.float32).reshape(-1, 3)
+    loop_verts = np.concatenate([block.ravel() for block in blocks])
+    sizes = np.concatenate([np.full(len(block), block.shape[1], dtype=np.int32) for block in blocks])
+    loop_starts = np.zeros(len(sizes), dtype=np.int32)
+    np.cumsum(sizes[:-1], out=loop_starts[1:])
+    return co, loop_verts, loop_starts
+
+
+# Unit plane and size-4 atmosphere cube buffers, packed once at import
+_PLANE_BUFFERS = pack_mesh_buffers(_PLANE_VERTS, _PLANE_FACES)
+_VOLUME_CUBE_BUFFERS = pack_mesh_buffers(_CUBE_VERTS * 2.0, _CUBE_FACES)
+
+
+def _bulk_mesh(name, co, loop_verts, loop_starts):
+    """Create a mesh by uploading flat vertex/loop/polygon buffers with foreach_set."""
+    mesh = bpy.data.meshes.new(name)
+    co = np.ascontiguousarray(co, dtype=np.float32).ravel()
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set("co", co)
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loop_verts, dtype=np.int32))
+    # Polygon sizes are derived from consecutive loop_start offsets
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(loop_starts, dtype=np.int32))
+    mesh.polygons.foreach_set("use_smooth", np.zeros(len(loop_starts), dtype=bool))
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _get_shared_light_mesh(key, name, buffers):
+    """Return a light mesh shared by every object of the same shape, with one material slot."""
+    mesh = _SHARED_LIGHT_MESHES.get(key)
+    if mesh is None:
+        mesh = _bulk_mesh(name, *buffers)
+        mesh.materials.append(None)
+        _SHARED_LIGHT_MESHES[key] = mesh
+    return mesh
+
+
+def _link_object_material(obj, mat):
+    """Assign a material on the object side so linked mesh data can stay shared."""
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
+
+
+def _emission_key(color, strength):
+    """Return the _EMISSION_MAT_CACHE key for an emission color and strength."""
+    return (tuple(round(c, 4) for c in color), round(strength, 3))
+
+
+def _get_emission_material(name, color, strength, shared=True):
+    """Return an emission material for (color, strength); shared ones are created once per value.
+
+    Lights whose material is retuned after creation (per house or per token) pass
+    shared=False, so writing to their material never reaches another light.
+    """
+    if not shared:
+        mat = bpy.data.materials.new(name=f"MAT_{name}")
+        _create_emission_node_tree(mat, color, strength)
+        return mat
+
+    key = _emission_key(color, strength)
+    mat = _EMISSION_MAT_CACHE.get(key)
+    if mat is None:
+        mat = bpy.data.materials.new(name=f"MAT_{name}")
+        _create_emission_node_tree(mat, color, strength)
+        _EMISSION_MAT_CACHE[key] = mat
+    return mat
 
-    # Scale to size
-    plane.scale = (size[0], size[1], 1.0)
 
-    # Apply rotation (degrees to radians)
-    plane.rotation_euler = (
-        math.radians(rotation[0]),
-        math.radians(rotation[1]),
-        math.radians(rotation[2])
-    )
+def _get_emission_node_group():
+    """Return the shared EmissionTemplate node group, building it once per scene."""
+    group = bpy.data.node_groups.get("EmissionTemplate")
+    if group is not None:
+        return group
 
-    # Create emission material
-    mat = bpy.data.materials.new(name=f"MAT_{name}")
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+    group = bpy.data.node_groups.new("EmissionTemplate", 'ShaderNodeTree')
+    color_socket = group.interface.new_socket("Color", in_out='INPUT', socket_type='NodeSocketColor')
+    color_socket.default_value = (1.0, 1.0, 1.0, 1.0)
+    strength_socket = group.interface.new_socket("Strength", in_out='INPUT', socket_type='NodeSocketFloat')
+    strength_socket.default_value = 1.0
+    group.interface.new_socket("Emission", in_out='OUTPUT', socket_type='NodeSocketShader')
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (300, 0)
+    nodes = group.nodes
+    links = group.links
+
+    group_in = nodes.new('NodeGroupInput')
+    group_in.location = (-300, 0)
 
     emission = nodes.new('ShaderNodeEmission')
     emission.location = (0, 0)
-    emission.inputs['Color'].default_value = (*color, 1.0)
-    emission.inputs['Strength'].default_value = strength
 
-    links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-    # Make plane invisible to camera
-    plane.visible_camera = False
-    plane.visible_diffuse = True
-    plane.visible_glossy = True
-    plane.visible_transmission = True
-    plane.visible_volume_scatter = True
+    group_out = nodes.new('NodeGroupOutput')
+    group_out.location = (300, 0)
 
-    plane.data.materials.append(mat)
+    links.new(group_in.outputs['Color'], emission.inputs['Color'])
+    links.new(group_in.outputs['Strength'], emission.inputs['Strength'])
+    links.new(emission.outputs['Emission'], group_out.inputs['Emission'])
+    return group
 
-    # Link to lights collection
-    collections['Lights'].objects.link(plane)
-    safe_unlink_from_scene(plane)
 
-    return plane
+def _new_node(nodes, node_type, name, location):
+    """Create a shader node with a canonical name, so equal graphs never pick up '.001' suffixes."""
+    node = nodes.new(node_type)
+    node.name = name
+    node.location = location
+    return node
 
 
-def create_emission_ring(name, radius, tube_radius, strength, color, location, rotation, collections):
-    """Create an emission ring (torus light)."""
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=radius,
-        minor_radius=tube_radius,
-        major_segments=64,
-        minor_segments=16,
-        location=location
-    )
-    ring = bpy.context.active_object
-    ring.name = name
-
-    # Apply rotation
-    ring.rotation_euler = (
-        math.radians(rotation[0]),
-        math.radians(rotation[1]),
-        math.radians(rotation[2])
-    )
-
-    # Create emission material
-    mat = bpy.data.materials.new(name=f"MAT_{name}")
+def _create_emission_node_tree(mat, color, strength):
+    """Build an EmissionTemplate group -> Output node tree on a material."""
     mat.use_nodes = True
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
     nodes.clear()
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (300, 0)
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (300, 0))
 
-    emission = nodes.new('ShaderNodeEmission')
-    emission.location = (0, 0)
+    emission = _new_node(nodes, 'ShaderNodeGroup', 'emission', (0, 0))
+    emission.node_tree = _get_emission_node_group()
     emission.inputs['Color'].default_value = (*color, 1.0)
     emission.inputs['Strength'].default_value = strength
 
     links.new(emission.outputs['Emission'], output.inputs['Surface'])
 
+
+def create_emission_plane(name, strength, color, matrix, collection, shared_material=True):
+    """Create an emission plane (softbox light) placed by a precomputed matrix."""
+    mesh = _get_shared_light_mesh("plane", "EmissionPlane", _PLANE_BUFFERS)
+    plane = bpy.data.objects.new(name, mesh)
+
+    # Single transform write: location @ rotation @ size
+    plane.matrix_world = matrix
+
+    # Emission material, shared between equal lights unless it gets retuned later
+    mat = _get_emission_material(name, color, strength, shared_material)
+
+    # Make plane invisible to camera; other ray visibility flags default to True
+    plane.visible_camera = False
+
+    _link_object_material(plane, mat)
+
+    # Data-API objects start unlinked, so only the target collection needs a link
+    collection.objects.link(plane)
+
+    return plane
+
+
+def create_emission_ring(name, radius, tube_radius, strength, color, matrix, collection):
+    """Create an emission ring (torus light) placed by a precomputed matrix."""
+    mesh = _get_shared_light_mesh(("ring", radius, tube_radius), "EmissionRing", _torus_buffers(radius, tube_radius))
+    ring = bpy.data.objects.new(name, mesh)
+
+    ring.matrix_world = matrix
+
+    # Shared emission material
+    mat = _get_emission_material(name, color, strength)
+
     ring.visible_camera = False
-    ring.data.materials.append(mat)
+    _link_object_material(ring, mat)
 
-    collections['Lights'].objects.link(ring)
-    safe_unlink_from_scene(ring)
+    collection.objects.link(ring)
 
     return ring
 
 
+def _light_size(light_def):
+    """Return a light's extent as an (x, y) pair regardless of light type."""
+    if light_def.type == "EMISSION_RING":
+        return (light_def.radius, light_def.tube_radius)
+    return light_def.size
+
+
+def _lights_to_soa(lights):
+    """Flatten light_defs into the struct-of-arrays transforms the light builders consume."""
+    soa = {
+        "type": [light_def.type for light_def in lights],
+        "loc": np.array([light_def.location for light_def in lights], dtype=np.float32).reshape(-1, 3),
+        "size": np.array([_light_size(light_def) for light_def in lights], dtype=np.float32).reshape(-1, 2),
+        "rot_deg": np.array([light_def.rotation for light_def in lights], dtype=np.float32).reshape(-1, 3),
+    }
+    soa["rot_rad"] = np.deg2rad(soa["rot_deg"])
+
+    # Only emission planes carry their size in the object transform
+    is_plane = np.array([light_type == "EMISSION_PLANE" for light_type in soa["type"]], dtype=bool)
+    scales = np.where(is_plane[:, None], soa["size"], 1.0)
+    soa["matrix"] = _compose_matrices(soa["loc"], soa["rot_rad"], scales)
+    return soa
+
+
+@functools.lru_cache(maxsize=None)
+def get_house_arrays(house_name):
+    """Return the struct-of-arrays light data for a single house, built on first use."""
+    return _lights_to_soa(HOUSES[house_name].light_signature)
+
+
+@functools.lru_cache(maxsize=None)
+def _base_light_matrices():
+    """Return world matrices for the shared key/fill/rim/accent planes, ready for matrix_world."""
+    base_lights = _LIGHTING_CFG
+    matrices = _compose_matrices(
+        np.array([light_def["location"] for light_def in base_lights.values()], dtype=np.float32),
+        np.deg2rad(np.array([light_def["rotation"] for light_def in base_lights.values()], dtype=np.float32)),
+        np.array([light_def["size"] for light_def in base_lights.values()], dtype=np.float32),
+    )
+    # matrix_world reads array input column-major, so hand it the transposes
+    return dict(zip(base_lights, matrices.transpose(0, 2, 1)))
+
+
 # ============================================================
 #                    MATERIAL CREATION
 # ============================================================
 
-def create_metallic_material(name, color, metallic=1.0, roughness=0.2, anisotropic=0.0):
-    """Create a high-quality metallic material."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+# Materials keyed by (creator name, rounded parameters); reset by clear_scene()
+_MAT_CACHE = {}
+
+
+def _material_key_value(value):
+    """Normalize a material parameter into a hashable, float-rounded cache key part."""
+    if isinstance(value, float):
+        return round(value, 4)
+    if isinstance(value, (tuple, list)):
+        return tuple(_material_key_value(v) for v in value)
+    return value
+
+
+def _cached_material(create):
+    """Reuse the material built by an earlier call with the same parameters (the name is ignored)."""
+    signature = inspect.signature(create)
+
+    @functools.wraps(create)
+    def wrapper(name, *args, **kwargs):
+        bound = signature.bind(name, *args, **kwargs)
+        bound.apply_defaults()
+        params = tuple(_material_key_value(v) for k, v in bound.arguments.items() if k != 'name')
+        key = (create.__name__, params)
+        mat = _MAT_CACHE.get(key)
+        if mat is None:
+            mat = create(name, *args, **kwargs)
+            _MAT_CACHE[key] = mat
+        return mat
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _principled_has_input(socket_name):
+    """Probe once whether this Blender's Principled BSDF has the named input socket."""
+    probe = bpy.data.node_groups.new(".PrincipledProbe", 'ShaderNodeTree')
+    try:
+        return socket_name in probe.nodes.new('ShaderNodeBsdfPrincipled').inputs
+    finally:
+        bpy.data.node_groups.remove(probe)
+
+
+def _material_from_template(family, build, name):
+    """Clone the family's template material (building it on first use) under a new name."""
+    template_name = f"{_MATERIAL_TEMPLATE_PREFIX}{family}"
+    template = bpy.data.materials.get(template_name)
+    if template is None:
+        template = bpy.data.materials.new(name=template_name)
+        template.use_fake_user = True
+        template.use_nodes = True
+        template.node_tree.nodes.clear()
+        build(template.node_tree.nodes, template.node_tree.links)
+
+    mat = template.copy()
+    mat.use_fake_user = False
+    mat.name = name
+    return mat
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
 
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (200, 0)
-    principled.inputs['Base Color'].default_value = (*color, 1.0)
-    principled.inputs['Metallic'].default_value = metallic
-    principled.inputs['Roughness'].default_value = roughness
-    principled.inputs['Anisotropic'].default_value = anisotropic
+_SHADER_CACHE_PREFIX = "_shader_cache_"
+
+
+def _default_shader_cache_dir():
+    """Return the per-user, per-Blender-version shader cache directory (kept out of --output-dir)."""
+    return bpy.utils.user_resource('DATAFILES', path="houseforge_shader_cache")
+
+
+@functools.lru_cache(maxsize=None)
+def _shader_cache_path(cache_dir):
+    """Return the template library path, keyed by this script and the Blender version so either change invalidates it."""
+    digest = hashlib.sha1()
+    with open(__file__, 'rb') as script:
+        digest.update(script.read())
+    digest.update(repr(bpy.app.version).encode())
+    return os.path.join(cache_dir, f"{_SHADER_CACHE_PREFIX}{digest.hexdigest()[:12]}.blend")
+
+
+def _is_template_name(name):
+    """Whether a material/world name belongs to a hidden fake-user template."""
+    return name.startswith(_MATERIAL_TEMPLATE_PREFIX) or name == _WORLD_TEMPLATE_NAME
+
+
+def load_shader_cache(cache_dir):
+    """Append cached template materials/world (and their node groups) instead of rebuilding them."""
+    path = _shader_cache_path(cache_dir)
+    if not os.path.exists(path):
+        return False
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.materials = [n for n in data_from.materials if _is_template_name(n) and n not in bpy.data.materials]
+        data_to.worlds = [n for n in data_from.worlds if _is_template_name(n) and n not in bpy.data.worlds]
+    return True
+
+
+def save_shader_cache(cache_dir):
+    """Write every template material/world to the shader cache library for later runs."""
+    templates = {
+        block for block in (*bpy.data.materials, *bpy.data.worlds)
+        if _is_template_name(block.name)
+    }
+    if not templates:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _shader_cache_path(cache_dir)
+    # Write beside the target and rename, so parallel workers never read a partial file
+    partial = f"{path}.{os.getpid()}.tmp"
+    bpy.data.libraries.write(partial, templates, fake_user=True)
+    os.replace(partial, path)
+
+    # Older script versions or Blender builds can never hit again
+    current = os.path.basename(path)
+    for entry in os.listdir(cache_dir):
+        if entry.startswith(_SHADER_CACHE_PREFIX) and entry.endswith(".blend") and entry != current:
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(cache_dir, entry))
+
+
+def _get_metallic_noise_node_group():
+    """Return the shared MetallicNoiseRoughness node group, building it once."""
+    group = bpy.data.node_groups.get("MetallicNoiseRoughness")
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new("MetallicNoiseRoughness", 'ShaderNodeTree')
+    group.interface.new_socket("Roughness In", in_out='INPUT', socket_type='NodeSocketFloat')
+    group.interface.new_socket("Roughness Out", in_out='OUTPUT', socket_type='NodeSocketFloat')
+
+    nodes = group.nodes
+    links = group.links
+
+    group_in = _new_node(nodes, 'NodeGroupInput', 'group_in', (-200, 0))
 
     # Subtle noise for realism
-    noise = nodes.new('ShaderNodeTexNoise')
-    noise.location = (-200, -200)
+    noise = _new_node(nodes, 'ShaderNodeTexNoise', 'noise', (-200, -200))
     noise.inputs['Scale'].default_value = 50
     noise.inputs['Detail'].default_value = 8
 
-    math_node = nodes.new('ShaderNodeMath')
-    math_node.location = (0, -200)
+    math_node = _new_node(nodes, 'ShaderNodeMath', 'mult0', (0, -200))
     math_node.operation = 'MULTIPLY'
     math_node.inputs[1].default_value = 0.02
 
-    add_node = nodes.new('ShaderNodeMath')
-    add_node.location = (0, -100)
+    add_node = _new_node(nodes, 'ShaderNodeMath', 'add0', (200, -100))
     add_node.operation = 'ADD'
-    add_node.inputs[1].default_value = roughness
+
+    group_out = _new_node(nodes, 'NodeGroupOutput', 'group_out', (400, -100))
 
     links.new(noise.outputs['Fac'], math_node.inputs[0])
     links.new(math_node.outputs[0], add_node.inputs[0])
-    links.new(add_node.outputs[0], principled.inputs['Roughness'])
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+    links.new(group_in.outputs['Roughness In'], add_node.inputs[1])
+    links.new(add_node.outputs[0], group_out.inputs['Roughness Out'])
+    return group
 
-    return mat
 
+def _build_metallic_template(nodes, links):
+    """Principled BSDF with noise-perturbed roughness."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (600, 0))
+    principled = _new_node(nodes, 'ShaderNodeBsdfPrincipled', 'principled', (200, 0))
 
-def create_glass_material(name, color, transmission=0.95, roughness=0.02, ior=1.45, dispersion=0.0):
-    """Create a high-quality glass/crystal material."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+    roughness_noise = _new_node(nodes, 'ShaderNodeGroup', 'roughness_noise', (0, -100))
+    roughness_noise.node_tree = _get_metallic_noise_node_group()
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (400, 0)
+    links.new(roughness_noise.outputs['Roughness Out'], principled.inputs['Roughness'])
+    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (0, 0)
-    principled.inputs['Base Color'].default_value = (*color, 1.0)
-    principled.inputs['Metallic'].default_value = 0.0
-    principled.inputs['Roughness'].default_value = roughness
-    principled.inputs['Transmission Weight'].default_value = transmission
-    principled.inputs['IOR'].default_value = ior
 
-    # Dispersion if supported
-    if dispersion > 0:
-        try:
-            principled.inputs['Dispersion'].default_value = dispersion
-        except:
-            pass
+def _build_glass_template(nodes, links):
+    """Single Principled BSDF."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (400, 0))
+    principled = _new_node(nodes, 'ShaderNodeBsdfPrincipled', 'principled', (0, 0))
+    principled.inputs['Metallic'].default_value = 0.0
 
     links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-    return mat
 
-
-def create_emissive_glass_material(name, color, emission_color, emission_strength=5.0, roughness=0.02, ior=1.45):
-    """Create glass with internal emission."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (800, 0)
+def _build_emissive_glass_template(nodes, links):
+    """Glass and emission mixed by fresnel."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (800, 0))
 
     # Glass base
-    glass = nodes.new('ShaderNodeBsdfPrincipled')
-    glass.location = (300, 200)
-    glass.inputs['Base Color'].default_value = (*color, 1.0)
-    glass.inputs['Roughness'].default_value = roughness
+    glass = _new_node(nodes, 'ShaderNodeBsdfPrincipled', 'glass', (300, 200))
     glass.inputs['Transmission Weight'].default_value = 0.9
-    glass.inputs['IOR'].default_value = ior
 
     # Emission
-    emission = nodes.new('ShaderNodeEmission')
-    emission.location = (300, -100)
-    emission.inputs['Color'].default_value = (*emission_color, 1.0)
-    emission.inputs['Strength'].default_value = emission_strength
+    emission = _new_node(nodes, 'ShaderNodeEmission', 'emission', (300, -100))
 
     # Mix via fresnel
-    fresnel = nodes.new('ShaderNodeFresnel')
-    fresnel.location = (100, 0)
+    fresnel = _new_node(nodes, 'ShaderNodeFresnel', 'fresnel', (100, 0))
     fresnel.inputs['IOR'].default_value = 1.4
 
-    mix = nodes.new('ShaderNodeMixShader')
-    mix.location = (550, 0)
+    mix = _new_node(nodes, 'ShaderNodeMixShader', 'mix', (550, 0))
 
     links.new(fresnel.outputs['Fac'], mix.inputs['Fac'])
     links.new(glass.outputs['BSDF'], mix.inputs[1])
     links.new(emission.outputs['Emission'], mix.inputs[2])
     links.new(mix.outputs['Shader'], output.inputs['Surface'])
 
-    return mat
-
 
-def create_frosted_glass_material(name, color, roughness=0.08, ior=1.31, subsurface_color=None, subsurface_strength=0.08, edge_frost=False):
-    """Create frosted glass with edge frost effect."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+def _build_frosted_glass_template(nodes, links):
+    """Transmissive Principled BSDF."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (800, 0))
+    principled = _new_node(nodes, 'ShaderNodeBsdfPrincipled', 'principled', (400, 0))
+    principled.inputs['Transmission Weight'].default_value = 0.88
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (800, 0)
+    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (400, 0)
-    principled.inputs['Base Color'].default_value = (*color, 1.0)
-    principled.inputs['Transmission Weight'].default_value = 0.88
-    principled.inputs['IOR'].default_value = ior
 
-    if subsurface_color:
-        principled.inputs['Subsurface Weight'].default_value = subsurface_strength
-        principled.inputs['Subsurface Radius'].default_value = (*subsurface_color, 1.0)[:3]
+def _build_frosted_glass_edge_template(nodes, links):
+    """Frosted glass whose roughness is boosted at grazing angles."""
+    _build_frosted_glass_template(nodes, links)
+    principled = nodes['principled']
 
-    if edge_frost:
-        # Fresnel-based roughness boost at edges
-        fresnel = nodes.new('ShaderNodeFresnel')
-        fresnel.location = (0, -100)
-        fresnel.inputs['IOR'].default_value = 1.3
-
-        math_mult = nodes.new('ShaderNodeMath')
-        math_mult.location = (150, -100)
-        math_mult.operation = 'MULTIPLY'
-        math_mult.inputs[1].default_value = 0.15  # edge boost
-
-        math_add = nodes.new('ShaderNodeMath')
-        math_add.location = (300, -100)
-        math_add.operation = 'ADD'
-        math_add.inputs[1].default_value = roughness
-
-        links.new(fresnel.outputs['Fac'], math_mult.inputs[0])
-        links.new(math_mult.outputs[0], math_add.inputs[0])
-        links.new(math_add.outputs[0], principled.inputs['Roughness'])
-    else:
-        principled.inputs['Roughness'].default_value = roughness
+    # Fresnel-based roughness boost at edges
+    fresnel = _new_node(nodes, 'ShaderNodeFresnel', 'fresnel', (0, -100))
+    fresnel.inputs['IOR'].default_value = 1.3
 
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+    math_mult = _new_node(nodes, 'ShaderNodeMath', 'mult0', (150, -100))
+    math_mult.operation = 'MULTIPLY'
+    math_mult.inputs[1].default_value = 0.15  # edge boost
 
-    return mat
+    math_add = _new_node(nodes, 'ShaderNodeMath', 'add0', (300, -100))
+    math_add.operation = 'ADD'
 
+    links.new(fresnel.outputs['Fac'], math_mult.inputs[0])
+    links.new(math_mult.outputs[0], math_add.inputs[0])
+    links.new(math_add.outputs[0], principled.inputs['Roughness'])
 
-def create_void_material(name, base_color, corona_color, corona_strength=8.0, fresnel_ior=2.5, fresnel_power=3.0):
-    """Create eclipse/void material with fresnel corona."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (800, 0)
+def _build_void_template(nodes, links):
+    """Black glossy base mixed with a fresnel-weighted corona emission."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (800, 0))
 
     # Black glossy base
-    glossy = nodes.new('ShaderNodeBsdfPrincipled')
-    glossy.location = (300, 200)
-    glossy.inputs['Base Color'].default_value = (*base_color, 1.0)
+    glossy = _new_node(nodes, 'ShaderNodeBsdfPrincipled', 'glossy', (300, 200))
     glossy.inputs['Metallic'].default_value = 1.0
     glossy.inputs['Roughness'].default_value = 0.1
 
     # Corona emission
-    emission = nodes.new('ShaderNodeEmission')
-    emission.location = (300, -100)
-    emission.inputs['Color'].default_value = (*corona_color, 1.0)
-    emission.inputs['Strength'].default_value = corona_strength
+    emission = _new_node(nodes, 'ShaderNodeEmission', 'emission', (300, -100))
 
     # Fresnel for edge glow
-    fresnel = nodes.new('ShaderNodeFresnel')
-    fresnel.location = (100, 0)
-    fresnel.inputs['IOR'].default_value = fresnel_ior
+    fresnel = _new_node(nodes, 'ShaderNodeFresnel', 'fresnel', (100, 0))
 
     # Power for sharper edge
-    power = nodes.new('ShaderNodeMath')
-    power.location = (200, 50)
+    power = _new_node(nodes, 'ShaderNodeMath', 'power', (200, 50))
     power.operation = 'POWER'
-    power.inputs[1].default_value = fresnel_power
 
-    mix = nodes.new('ShaderNodeMixShader')
-    mix.location = (550, 0)
+    mix = _new_node(nodes, 'ShaderNodeMixShader', 'mix', (550, 0))
 
     links.new(fresnel.outputs['Fac'], power.inputs[0])
     links.new(power.outputs[0], mix.inputs['Fac'])
@@ -791,84 +1237,47 @@ def create_void_material(name, base_color, corona_color, corona_strength=8.0, fr
     links.new(emission.outputs['Emission'], mix.inputs[2])
     links.new(mix.outputs['Shader'], output.inputs['Surface'])
 
-    return mat
-
 
-def create_iridescent_glass_material(name, color, roughness=0.02, ior=1.48, irid_strength=0.15, irid_shift=0.3):
-    """Create iridescent glass for aurora effect."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
-
-    principled = nodes.new('ShaderNodeBsdfPrincipled')
-    principled.location = (200, 0)
-    principled.inputs['Base Color'].default_value = (*color, 1.0)
-    principled.inputs['Roughness'].default_value = roughness
+def _build_iridescent_glass_template(nodes, links):
+    """Transmissive Principled BSDF tinted by a facing-ratio color ramp."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (600, 0))
+    principled = _new_node(nodes, 'ShaderNodeBsdfPrincipled', 'principled', (200, 0))
     principled.inputs['Transmission Weight'].default_value = 0.9
-    principled.inputs['IOR'].default_value = ior
 
     # Iridescence is view-angle dependent color shift
     # Simulate with layer weight + color ramp
-    layer_weight = nodes.new('ShaderNodeLayerWeight')
-    layer_weight.location = (-200, 100)
+    layer_weight = _new_node(nodes, 'ShaderNodeLayerWeight', 'layer_weight', (-200, 100))
     layer_weight.inputs['Blend'].default_value = 0.5
 
-    color_ramp = nodes.new('ShaderNodeValToRGB')
-    color_ramp.location = (0, 100)
+    color_ramp = _new_node(nodes, 'ShaderNodeValToRGB', 'color_ramp', (0, 100))
     color_ramp.color_ramp.elements[0].color = (0.9, 0.8, 1.0, 1.0)  # Pale purple
     color_ramp.color_ramp.elements[1].color = (0.8, 1.0, 0.9, 1.0)  # Pale green
 
-    mix_rgb = nodes.new('ShaderNodeMix')
-    mix_rgb.location = (0, 0)
+    mix_rgb = _new_node(nodes, 'ShaderNodeMix', 'mix_rgb', (0, 0))
     mix_rgb.data_type = 'RGBA'
-    mix_rgb.inputs['Factor'].default_value = irid_strength
 
     links.new(layer_weight.outputs['Facing'], color_ramp.inputs['Fac'])
     links.new(color_ramp.outputs['Color'], mix_rgb.inputs['B'])
-    mix_rgb.inputs['A'].default_value = (*color, 1.0)
     links.new(mix_rgb.outputs['Result'], principled.inputs['Base Color'])
     links.new(principled.outputs['BSDF'], output.inputs['Surface'])
 
-    return mat
 
+def _build_gradient_emission_template(nodes, links):
+    """Spherical-gradient emission over a transparent base."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (600, 0))
 
-def create_gradient_emission_material(name, color1, color2, strength=5.0):
-    """Create gradient emission for aurora ribbons."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (600, 0)
+    tex_coord = _new_node(nodes, 'ShaderNodeTexCoord', 'tex_coord', (-400, 0))
 
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-400, 0)
-
-    gradient = nodes.new('ShaderNodeTexGradient')
-    gradient.location = (-200, 0)
+    gradient = _new_node(nodes, 'ShaderNodeTexGradient', 'gradient', (-200, 0))
     gradient.gradient_type = 'SPHERICAL'
 
-    color_ramp = nodes.new('ShaderNodeValToRGB')
-    color_ramp.location = (0, 0)
-    color_ramp.color_ramp.elements[0].color = (*color1, 1.0)
-    color_ramp.color_ramp.elements[1].color = (*color2, 1.0)
+    color_ramp = _new_node(nodes, 'ShaderNodeValToRGB', 'color_ramp', (0, 0))
 
-    emission = nodes.new('ShaderNodeEmission')
-    emission.location = (200, 0)
-    emission.inputs['Strength'].default_value = strength
+    emission = _new_node(nodes, 'ShaderNodeEmission', 'emission', (200, 0))
 
-    transparent = nodes.new('ShaderNodeBsdfTransparent')
-    transparent.location = (200, -200)
+    transparent = _new_node(nodes, 'ShaderNodeBsdfTransparent', 'transparent', (200, -200))
 
-    mix = nodes.new('ShaderNodeMixShader')
-    mix.location = (400, 0)
+    mix = _new_node(nodes, 'ShaderNodeMixShader', 'mix', (400, 0))
     mix.inputs['Fac'].default_value = 0.85
 
     links.new(tex_coord.outputs['Object'], gradient.inputs['Vector'])
@@ -878,36 +1287,151 @@ def create_gradient_emission_material(name, color1, color2, strength=5.0):
     links.new(emission.outputs['Emission'], mix.inputs[2])
     links.new(mix.outputs['Shader'], output.inputs['Surface'])
 
-    return mat
-
-
-def create_emission_material(name, color, strength=5.0):
-    """Create simple emission material."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (400, 0)
+def _build_emission_template(nodes, links):
+    """Emission mixed over a transparent base."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (400, 0))
 
-    emission = nodes.new('ShaderNodeEmission')
-    emission.location = (100, 100)
-    emission.inputs['Color'].default_value = (*color, 1.0)
-    emission.inputs['Strength'].default_value = strength
+    emission = _new_node(nodes, 'ShaderNodeEmission', 'emission', (100, 100))
 
-    transparent = nodes.new('ShaderNodeBsdfTransparent')
-    transparent.location = (100, -100)
+    transparent = _new_node(nodes, 'ShaderNodeBsdfTransparent', 'transparent', (100, -100))
 
-    mix = nodes.new('ShaderNodeMixShader')
-    mix.location = (250, 0)
+    mix = _new_node(nodes, 'ShaderNodeMixShader', 'mix', (250, 0))
     mix.inputs['Fac'].default_value = 0.9
 
     links.new(transparent.outputs['BSDF'], mix.inputs[1])
     links.new(emission.outputs['Emission'], mix.inputs[2])
     links.new(mix.outputs['Shader'], output.inputs['Surface'])
 
+
+@_cached_material
+def create_metallic_material(name, color, metallic=1.0, roughness=0.2, anisotropic=0.0):
+    """Create a high-quality metallic material."""
+    mat = _material_from_template('metallic', _build_metallic_template, name)
+    nodes = mat.node_tree.nodes
+
+    principled = nodes['principled']
+    principled.inputs['Base Color'].default_value = (*color, 1.0)
+    principled.inputs['Metallic'].default_value = metallic
+    principled.inputs['Roughness'].default_value = roughness
+    principled.inputs['Anisotropic'].default_value = anisotropic
+    nodes['roughness_noise'].inputs['Roughness In'].default_value = roughness
+
+    return mat
+
+
+@_cached_material
+def create_glass_material(name, color, transmission=0.95, roughness=0.02, ior=1.45, dispersion=0.0):
+    """Create a high-quality glass/crystal material."""
+    mat = _material_from_template('glass', _build_glass_template, name)
+
+    principled = mat.node_tree.nodes['principled']
+    principled.inputs['Base Color'].default_value = (*color, 1.0)
+    principled.inputs['Roughness'].default_value = roughness
+    principled.inputs['Transmission Weight'].default_value = transmission
+    principled.inputs['IOR'].default_value = ior
+
+    # Dispersion if supported
+    if dispersion > 0 and _principled_has_input('Dispersion'):
+        principled.inputs['Dispersion'].default_value = dispersion
+
+    return mat
+
+
+@_cached_material
+def create_emissive_glass_material(name, color, emission_color, emission_strength=5.0, roughness=0.02, ior=1.45):
+    """Create glass with internal emission."""
+    mat = _material_from_template('emissive_glass', _build_emissive_glass_template, name)
+    nodes = mat.node_tree.nodes
+
+    glass = nodes['glass']
+    glass.inputs['Base Color'].default_value = (*color, 1.0)
+    glass.inputs['Roughness'].default_value = roughness
+    glass.inputs['IOR'].default_value = ior
+
+    emission = nodes['emission']
+    emission.inputs['Color'].default_value = (*emission_color, 1.0)
+    emission.inputs['Strength'].default_value = emission_strength
+
+    return mat
+
+
+@_cached_material
+def create_frosted_glass_material(name, color, roughness=0.08, ior=1.31, subsurface_color=None, subsurface_strength=0.08, edge_frost=False):
+    """Create frosted glass with edge frost effect."""
+    if edge_frost:
+        mat = _material_from_template('frosted_glass_edge', _build_frosted_glass_edge_template, name)
+        mat.node_tree.nodes['add0'].inputs[1].default_value = roughness
+    else:
+        mat = _material_from_template('frosted_glass', _build_frosted_glass_template, name)
+        mat.node_tree.nodes['principled'].inputs['Roughness'].default_value = roughness
+
+    principled = mat.node_tree.nodes['principled']
+    principled.inputs['Base Color'].default_value = (*color, 1.0)
+    principled.inputs['IOR'].default_value = ior
+
+    if subsurface_color:
+        principled.inputs['Subsurface Weight'].default_value = subsurface_strength
+        principled.inputs['Subsurface Radius'].default_value = (*subsurface_color, 1.0)[:3]
+
+    return mat
+
+
+@_cached_material
+def create_void_material(name, base_color, corona_color, corona_strength=8.0, fresnel_ior=2.5, fresnel_power=3.0):
+    """Create eclipse/void material with fresnel corona."""
+    mat = _material_from_template('void', _build_void_template, name)
+    nodes = mat.node_tree.nodes
+
+    nodes['glossy'].inputs['Base Color'].default_value = (*base_color, 1.0)
+    nodes['emission'].inputs['Color'].default_value = (*corona_color, 1.0)
+    nodes['emission'].inputs['Strength'].default_value = corona_strength
+    nodes['fresnel'].inputs['IOR'].default_value = fresnel_ior
+    nodes['power'].inputs[1].default_value = fresnel_power
+
+    return mat
+
+
+@_cached_material
+def create_iridescent_glass_material(name, color, roughness=0.02, ior=1.48, irid_strength=0.15, irid_shift=0.3):
+    """Create iridescent glass for aurora effect."""
+    mat = _material_from_template('iridescent_glass', _build_iridescent_glass_template, name)
+    nodes = mat.node_tree.nodes
+
+    principled = nodes['principled']
+    principled.inputs['Base Color'].default_value = (*color, 1.0)
+    principled.inputs['Roughness'].default_value = roughness
+    principled.inputs['IOR'].default_value = ior
+
+    mix_rgb = nodes['mix_rgb']
+    mix_rgb.inputs['Factor'].default_value = irid_strength
+    mix_rgb.inputs['A'].default_value = (*color, 1.0)
+
+    return mat
+
+
+@_cached_material
+def create_gradient_emission_material(name, color1, color2, strength=5.0):
+    """Create gradient emission for aurora ribbons."""
+    mat = _material_from_template('gradient_emission', _build_gradient_emission_template, name)
+    nodes = mat.node_tree.nodes
+
+    # Both stop colors in one bulk write
+    nodes['color_ramp'].color_ramp.elements.foreach_set("color", (*color1, 1.0, *color2, 1.0))
+    nodes['emission'].inputs['Strength'].default_value = strength
+
+    return mat
+
+
+@_cached_material
+def create_emission_material(name, color, strength=5.0):
+    """Create simple emission material."""
+    mat = _material_from_template('emission', _build_emission_template, name)
+
+    emission = mat.node_tree.nodes['emission']
+    emission.inputs['Color'].default_value = (*color, 1.0)
+    emission.inputs['Strength'].default_value = strength
+
     return mat
 
 
@@ -915,573 +1439,720 @@ def create_emission_material(name, color, strength=5.0):
 #                    GEOMETRY CREATION
 # ============================================================
 
+# Geometry is assembled as packed (verts, loop_verts, loop_starts) parts and
+# uploaded once with _bulk_mesh; ring angles follow Blender's primitives,
+# which start at +Y and wind clockwise seen from above. Primitives are built
+# once at unit size and scaled per call; the unit tables are shared, so
+# callers must treat index buffers as read-only.
+
+# Unit icosahedron (same vertex/face layout as primitive_ico_sphere_add)
+_ICO_VERTS = np.array([
+    (0.0, 0.0, -1.0),
+    (0.7236, -0.52572, -0.44721), (-0.27639, -0.85064, -0.44721), (-0.89442, 0.0, -0.44721),
+    (-0.27639, 0.85064, -0.44721), (0.7236, 0.52572, -0.44721),
+    (0.27639, -0.85064, 0.44721), (-0.7236, -0.52572, 0.44721), (-0.7236, 0.52572, 0.44721),
+    (0.27639, 0.85064, 0.44721), (0.89442, 0.0, 0.44721),
+    (0.0, 0.0, 1.0),
+], dtype=np.float64)
+_ICO_FACES = np.array([
+    (0, 1, 2), (1, 0, 5), (0, 2, 3), (0, 3, 4), (0, 4, 5),
+    (1, 5, 10), (2, 1, 6), (3, 2, 7), (4, 3, 8), (5, 4, 9),
+    (1, 10, 6), (2, 6, 7), (3, 7, 8), (4, 8, 9), (5, 9, 10),
+    (6, 10, 11), (7, 6, 11), (8, 7, 11), (9, 8, 11), (10, 9, 11),
+], dtype=np.int32)
+
+
+# Displacement textures keyed by (type, noise_scale, noise_depth); reset by clear_scene()
+_TEX_CACHE = {}
+
+# Auto-handle length of primitive_bezier_circle_add's four points, relative to its radius
+_BEZIER_CIRCLE_HANDLE = 0.5521252
+
+
+def _ring_angles(count):
+    """Return Blender primitive ring angles: starting at +Y, clockwise from above."""
+    return (np.pi / 2 - np.arange(count) * (2 * np.pi / count)).astype(np.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_ico_sphere(subdivisions):
+    """Build a unit icosphere, cutting each icosahedron edge 2^(subdivisions-1) times like Blender."""
+    n = 1 << (subdivisions - 1)
+    unit = _ICO_VERTS / np.linalg.norm(_ICO_VERTS, axis=1)[:, None]
+    a, b, c = (unit[_ICO_FACES[:, k]] for k in range(3))
+
+    # Rows run from corner a toward edge bc; row ends sit on the sphere before the row is cut
+    rows, cols = np.array([(r, t) for r in range(n + 1) for t in range(r + 1)]).T
+    left = a[:, None] + (b - a)[:, None] * (rows / n)[None, :, None]
+    right = a[:, None] + (c - a)[:, None] * (rows / n)[None, :, None]
+    left /= np.linalg.norm(left, axis=-1, keepdims=True)
+    right /= np.linalg.norm(right, axis=-1, keepdims=True)
+    frac = np.divide(cols, rows, out=np.zeros(len(rows)), where=rows > 0)[None, :, None]
+    points = left + (right - left) * frac
+    points /= np.linalg.norm(points, axis=-1, keepdims=True)
+
+    # Weld the copies of each shared edge/corner point
+    verts, index = np.unique(np.round(points.reshape(-1, 3), 6), axis=0, return_inverse=True)
+    index = index.reshape(len(_ICO_FACES), -1)
+
+    # Local grid id of (row, col), then up- and down-pointing triangles per face
+    grid = {(r, t): k for k, (r, t) in enumerate(zip(rows, cols))}
+    local = [(grid[r, t], grid[r + 1, t], grid[r + 1, t + 1]) for r in range(n) for t in range(r + 1)]
+    local += [(grid[r, t], grid[r + 1, t + 1], grid[r, t + 1]) for r in range(1, n) for t in range(r)]
+    faces = index[:, np.array(local)].reshape(-1, 3)
+    return pack_mesh_buffers(verts, faces)
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_uv_sphere(segments, ring_count):
+    """Build a unit UV sphere: (ring_count - 1) rings of quads closed by triangle fans at the poles."""
+    theta = _ring_angles(segments)
+    phi = (np.arange(1, ring_count) * (np.pi / ring_count)).astype(np.float32)
+    ring_radius = np.sin(phi)[:, None]
+    verts = np.stack((
+        ring_radius * np.cos(theta)[None, :],
+        ring_radius * np.sin(theta)[None, :],
+        np.broadcast_to(np.cos(phi)[:, None], (len(phi), segments)),
+    ), axis=-1).reshape(-1, 3)
+    top, bottom = len(verts), len(verts) + 1
+    verts = np.concatenate((verts, np.array([(0.0, 0.0, 1.0), (0.0, 0.0, -1.0)], dtype=np.float32)))
+
+    j = np.arange(segments)
+    j_next = (j + 1) % segments
+    rows = np.arange(ring_count - 2)[:, None] * segments
+    quads = np.stack((rows + j, rows + j_next, rows + segments + j_next, rows + segments + j), axis=-1).reshape(-1, 4)
+    last = (ring_count - 2) * segments
+    top_fan = np.stack((np.full(segments, top), j_next, j), axis=1)
+    bottom_fan = np.stack((np.full(segments, bottom), last + j, last + j_next), axis=1)
+    return pack_mesh_buffers(verts, top_fan, quads, bottom_fan)
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_cone(vertices):
+    """Build a pointed unit cone (radius 1, n-gon base at z = -0.5, tip at z = 0.5)."""
+    theta = _ring_angles(vertices)
+    base = np.stack((np.cos(theta), np.sin(theta), np.full(vertices, -0.5, dtype=np.float32)), axis=1)
+    verts = np.concatenate((base, np.array([(0.0, 0.0, 0.5)], dtype=np.float32)))
+    j = np.arange(vertices)
+    sides = np.stack((j, np.full(vertices, vertices), (j + 1) % vertices), axis=1)
+    return pack_mesh_buffers(verts, sides, j[None, :])
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_cylinder(vertices):
+    """Build a capped unit cylinder (radius 1, depth 1) centred on the origin."""
+    theta = _ring_angles(vertices)
+    ring = np.stack((np.cos(theta), np.sin(theta)), axis=1)
+    verts = np.concatenate((
+        np.column_stack((ring, np.full(vertices, -0.5, dtype=np.float32))),
+        np.column_stack((ring, np.full(vertices, 0.5, dtype=np.float32))),
+    ))
+    j = np.arange(vertices)
+    j_next = (j + 1) % vertices
+    sides = np.stack((j, j + vertices, j_next + vertices, j_next), axis=1)
+    return pack_mesh_buffers(verts, sides, (j + vertices)[::-1][None, :], j[None, :])
+
+
+def _scaled_part(part, scale):
+    """Scale a unit part's vertices per axis, sharing its index buffers."""
+    verts, loop_verts, loop_starts = part
+    return verts * np.asarray(scale, dtype=np.float32), loop_verts, loop_starts
+
+
+def _ico_sphere_part(radius, subdivisions):
+    """Build an icosphere part from the unit table."""
+    return _scaled_part(_unit_ico_sphere(subdivisions), (radius, radius, radius))
+
+
+def _uv_sphere_part(radius, segments, ring_count):
+    """Build a UV sphere part from the unit table."""
+    return _scaled_part(_unit_uv_sphere(segments, ring_count), (radius, radius, radius))
+
+
+def _cone_part(vertices, radius, depth):
+    """Build a pointed cone part (n-gon base at -depth/2, tip at +depth/2) from the unit table."""
+    return _scaled_part(_unit_cone(vertices), (radius, radius, depth))
+
+
+def _cylinder_part(vertices, radius, depth):
+    """Build a capped cylinder part centred on the origin from the unit table."""
+    return _scaled_part(_unit_cylinder(vertices), (radius, radius, depth))
+
+
+def _build_primitive_tables():
+    """Generate the unit tables for every segment/ring count the builders use."""
+    for subdivisions in (1, 2, 3):
+        _unit_ico_sphere(subdivisions)
+    for segments, ring_count in ((48, 24), (64, 32)):
+        _unit_uv_sphere(segments, ring_count)
+    for vertices in (3, 4, 6, 8):
+        _unit_cone(vertices)
+    for vertices in (4, 6, 8, 32):
+        _unit_cylinder(vertices)
+    for major_segments, minor_segments in ((64, 16), (64, 12), (64, 8), (48, 8)):
+        _unit_torus(major_segments, minor_segments)
+
+
+_build_primitive_tables()
+
+
+def _polyline_tubes(paths, radius, segments):
+    """Sweep a round cross-section along open polylines, matching a beveled POLY curve converted to mesh.
+
+    paths is (count, points, 3). The first cross-section faces along the first segment
+    with a horizontal X axis; later ones are carried along by minimum-twist rotations.
+    """
+    paths = np.asarray(paths, dtype=np.float64)
+    count, points = paths.shape[:2]
+
+    # Segment directions; interior points use the bisector of their two segments
+    seg_dirs = np.diff(paths, axis=1)
+    seg_dirs /= np.linalg.norm(seg_dirs, axis=-1, keepdims=True)
+    tangents = np.concatenate((seg_dirs[:, :1], seg_dirs[:, :-1] + seg_dirs[:, 1:], seg_dirs[:, -1:]), axis=1)
+    tangents /= np.linalg.norm(tangents, axis=-1, keepdims=True)
+
+    first = tangents[:, 0]
+    x_axis = np.column_stack((first[:, 1], -first[:, 0], np.zeros(count)))
+    x_axis /= np.linalg.norm(x_axis, axis=-1, keepdims=True)
+    y_axis = np.cross(-first, x_axis)
+    frames = [(x_axis, y_axis)]
+    for i in range(1, points):
+        # Rodrigues rotation taking tangent i-1 onto tangent i, applied to both frame axes
+        axis = np.cross(tangents[:, i - 1], tangents[:, i])
+        cos = np.sum(tangents[:, i - 1] * tangents[:, i], axis=-1, keepdims=True)
+        frames.append(tuple(
+            v * cos + np.cross(axis, v) + axis * np.sum(axis * v, axis=-1, keepdims=True) / (1.0 + cos)
+            for v in frames[-1]
+        ))
+    x_axes = np.stack([x for x, _ in frames], axis=1)
+    y_axes = np.stack([y for _, y in frames], axis=1)
+
+    theta = np.pi - np.arange(1, segments + 1) * (2 * np.pi / segments)
+    verts = (
+        paths[:, :, None, :]
+        + radius * np.cos(theta)[None, None, :, None] * x_axes[:, :, None, :]
+        + radius * np.sin(theta)[None, None, :, None] * y_axes[:, :, None, :]
+    )
+
+    k = np.arange(segments)
+    rows = np.arange(points - 1)[:, None] * segments
+    quads = np.stack((rows + k, rows + segments + k, rows + segments + (k - 1) % segments, rows + (k - 1) % segments), axis=-1)
+    _, loop_verts, loop_starts = pack_mesh_buffers(verts[0].reshape(-1, 3), quads.reshape(-1, 4))
+    return _tile_part(verts.reshape(count, -1, 3), loop_verts, loop_starts)
+
+
+def _bezier_circle_path(radius, resolution=12):
+    """Sample the 4-point auto-handle Bezier circle of primitive_bezier_circle_add like its tessellation."""
+    # Control points run clockwise from -X; tessellation starts on the closing segment from -Y
+    points = radius * np.array([(-1.0, 0.0), (0.0, 1.0), (1.0, 0.0), (0.0, -1.0)])
+    tangents = np.array([(0.0, 1.0), (1.0, 0.0), (0.0, -1.0), (-1.0, 0.0)])
+    handle = radius * _BEZIER_CIRCLE_HANDLE
+    start = np.roll(points, 1, axis=0)
+    end = points
+    t = (np.arange(resolution) / resolution)[None, :, None]
+    path = (
+        (1 - t) ** 3 * start[:, None]
+        + 3 * (1 - t) ** 2 * t * (start + np.roll(tangents, 1, axis=0) * handle)[:, None]
+        + 3 * (1 - t) * t ** 2 * (end - tangents * handle)[:, None]
+        + t ** 3 * end[:, None]
+    ).reshape(-1, 2)
+    return np.column_stack((path, np.zeros(len(path))))
+
+
+def _closed_ring_tube(path, radius, segments):
+    """Sweep a round cross-section around a closed path in the XY plane, matching a beveled cyclic curve."""
+    # Bisector tangents; planar minimum twist keeps every cross-section spanned by the outward normal and +Z
+    forward = np.roll(path, -1, axis=0) - path
+    forward /= np.linalg.norm(forward, axis=1, keepdims=True)
+    tangents = forward + np.roll(forward, 1, axis=0)
+    tangents /= np.linalg.norm(tangents, axis=1, keepdims=True)
+    outward = np.column_stack((-tangents[:, 1], tangents[:, 0], np.zeros(len(path))))
+
+    theta = np.arange(1, segments + 1) * (2 * np.pi / segments)
+    verts = (
+        path[:, None, :]
+        + radius * np.cos(theta)[None, :, None] * outward[:, None, :]
+        + radius * np.sin(theta)[None, :, None] * np.array([0.0, 0.0, 1.0])
+    )
+
+    count = len(path)
+    k = np.arange(segments)
+    rows = np.arange(count)[:, None] * segments
+    next_rows = (np.arange(count)[:, None] + 1) % count * segments
+    quads = np.stack((rows + k, next_rows + k, next_rows + (k - 1) % segments, rows + (k - 1) % segments), axis=-1)
+    return pack_mesh_buffers(verts.reshape(-1, 3), quads.reshape(-1, 4))
+
+
+def _instance_parts(part, locations, rotations):
+    """Merge copies of a part placed by per-instance locations and XYZ Euler rotations (radians)."""
+    locations = np.asarray(locations, dtype=np.float32).reshape(-1, 3)
+    rotations = np.asarray(rotations, dtype=np.float32).reshape(-1, 3)
+    matrices = _compose_matrices(locations, rotations, np.ones((len(locations), 2), dtype=np.float32))
+    verts, loop_verts, loop_starts = part
+    placed = np.einsum('kij,nj->kni', matrices[:, :3, :3], verts) + matrices[:, None, :3, 3]
+    return _tile_part(placed, loop_verts, loop_starts)
+
+
+def _tile_part(copies, loop_verts, loop_starts):
+    """Merge (count, verts, 3) copies that share one topology, offsetting indices by broadcasting."""
+    count, vert_count = copies.shape[:2]
+    vert_offsets = np.arange(count, dtype=np.int32)[:, None] * vert_count
+    loop_offsets = np.arange(count, dtype=np.int32)[:, None] * len(loop_verts)
+    return (
+        copies.reshape(-1, 3).astype(np.float32, copy=False),
+        (loop_verts[None, :] + vert_offsets).ravel(),
+        (loop_starts[None, :] + loop_offsets).ravel(),
+    )
+
+
+def _merge_parts(parts):
+    """Concatenate parts into one, offsetting loop vertex indices and loop starts."""
+    vert_counts = [len(verts) for verts, _, _ in parts]
+    loop_counts = [len(loop_verts) for _, loop_verts, _ in parts]
+    co = np.concatenate([verts for verts, _, _ in parts], dtype=np.float32)
+    loop_verts = np.concatenate([loop_verts for _, loop_verts, _ in parts], dtype=np.int32)
+    loop_starts = np.concatenate([loop_starts for _, _, loop_starts in parts], dtype=np.int32)
+
+    # Shift each part's indices in place within the merged buffers
+    loop_verts += np.repeat(np.cumsum([0] + vert_counts[:-1]), loop_counts).astype(np.int32)
+    loop_starts += np.repeat(np.cumsum([0] + loop_counts[:-1]), [len(starts) for _, _, starts in parts]).astype(np.int32)
+    return co, loop_verts, loop_starts
+
+
+def _new_mesh_object(name, part):
+    """Create an unlinked mesh object from a packed part."""
+    return bpy.data.objects.new(name, _bulk_mesh(name, *part))
+
+
+def _shade_smooth(obj):
+    """Mark every face of an object's mesh as smooth-shaded."""
+    polygons = obj.data.polygons
+    polygons.foreach_set("use_smooth", np.ones(len(polygons), dtype=bool))
+
+
 def create_faceted_sphere(name, radius=0.4, subdivisions=2):
     """Create a faceted icosphere."""
-    bpy.ops.mesh.primitive_ico_sphere_add(radius=radius, subdivisions=subdivisions, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = name
+    obj = _new_mesh_object(name, _ico_sphere_part(radius, subdivisions))
 
-    bpy.ops.object.modifier_add(type='DISPLACE')
-    obj.modifiers['Displace'].strength = 0.02
+    obj.modifiers.new('Displace', 'DISPLACE').strength = 0.02
 
-    bpy.ops.object.modifier_add(type='SUBSURF')
-    obj.modifiers['Subdivision'].levels = 1
-    obj.modifiers['Subdivision'].render_levels = 2
+    subsurf = obj.modifiers.new('Subdivision', 'SUBSURF')
+    subsurf.levels = 1
+    subsurf.render_levels = 2
 
     return obj
 
 
 def create_water_drop_shape(name, radius=0.4):
     """Create a water drop shape."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=radius, segments=48, ring_count=24, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = name
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='DESELECT')
-    bm = bmesh.from_edit_mesh(obj.data)
-
-    for v in bm.verts:
-        if v.co.z > 0:
-            factor = v.co.z / radius
-            v.co.z += factor * 0.3
-            scale = 1.0 - (factor * 0.5)
-            v.co.x *= scale
-            v.co.y *= scale
-
-    bmesh.update_edit_mesh(obj.data)
-    bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.shade_smooth()
+    verts, loop_verts, loop_starts = _uv_sphere_part(radius, 48, 24)
+
+    # Stretch the upper hemisphere into a tip: raise it and pinch it inwards
+    co = verts.copy()
+    upper = co[:, 2] > 0
+    factor = co[upper, 2] / radius
+    co[upper, 2] += factor * 0.3
+    co[upper, :2] *= (1.0 - factor * 0.5)[:, None]
+
+    obj = _new_mesh_object(name, (co, loop_verts, loop_starts))
+    _shade_smooth(obj)
 
     return obj
 
 
+def _get_clouds_texture(name, noise_scale, noise_depth):
+    """Return a shared CLOUDS texture for (noise_scale, noise_depth), creating it once."""
+    key = ('CLOUDS', round(noise_scale, 4), noise_depth)
+    tex = _TEX_CACHE.get(key)
+    if tex is None:
+        tex = bpy.data.textures.new(name, type='CLOUDS')
+        tex.noise_scale = noise_scale
+        tex.noise_depth = noise_depth
+        _TEX_CACHE[key] = tex
+    return tex
+
+
 def create_plasma_orb(name, radius=0.35):
     """Create a plasma orb."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=radius, segments=64, ring_count=32, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = name
-
-    bpy.ops.object.modifier_add(type='DISPLACE')
-    displace = obj.modifiers['Displace']
-    tex = bpy.data.textures.new(name + "_noise", type='CLOUDS')
-    tex.noise_scale = 0.5
-    tex.noise_depth = 4
-    displace.texture = tex
+    obj = _new_mesh_object(name, _uv_sphere_part(radius, 64, 32))
+
+    displace = obj.modifiers.new('Displace', 'DISPLACE')
+    displace.texture = _get_clouds_texture(name + "_noise", 0.5, 4)
     displace.strength = 0.08
 
-    bpy.ops.object.shade_smooth()
+    _shade_smooth(obj)
     return obj
 
 
 def create_ice_crystal(name, size=0.5):
     """Create an ice crystal shape."""
-    bpy.ops.mesh.primitive_cone_add(vertices=6, radius1=size*0.4, radius2=0, depth=size, location=(0, 0, size/2))
-    top = bpy.context.active_object
+    # Both cones in the top cone's local space, which is where the crystal has always sat
+    top = _cone_part(6, size * 0.4, size)
+    bottom = _instance_parts(_cone_part(6, size * 0.4, size * 0.6), (0, 0, -size * 0.8), (math.pi, 0, 0))
+    obj = _new_mesh_object(name, _merge_parts([top, bottom]))
 
-    bpy.ops.mesh.primitive_cone_add(vertices=6, radius1=size*0.4, radius2=0, depth=size*0.6, location=(0, 0, -size*0.3))
-    bottom = bpy.context.active_object
-    bottom.rotation_euler = (math.pi, 0, 0)
+    bevel = obj.modifiers.new('Bevel', 'BEVEL')
+    bevel.width = 0.01
+    bevel.segments = 2
 
-    top.select_set(True)
-    bpy.context.view_layer.objects.active = top
-    bpy.ops.object.join()
-
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.location = (0, 0, 0)
+    return obj
 
-    bpy.ops.object.modifier_add(type='BEVEL')
-    obj.modifiers['Bevel'].width = 0.01
-    obj.modifiers['Bevel'].segments = 2
 
-    return obj
+# Turns the 4-sided cone so its base edges run along the X/Y axes
+_PYRAMID_ROTATION = (0.0, 0.0, math.radians(45))
 
 
 def create_pyramid_core(name, size=0.5):
     """Create a pyramid core."""
-    bpy.ops.mesh.primitive_cone_add(vertices=4, radius1=size*0.6, radius2=0, depth=size*0.8, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.rotation_euler = (0, 0, math.radians(45))
+    obj = _new_mesh_object(name, _cone_part(4, size * 0.6, size * 0.8))
+    obj.rotation_euler = _PYRAMID_ROTATION
 
-    bpy.ops.object.modifier_add(type='BEVEL')
-    obj.modifiers['Bevel'].width = 0.015
-    obj.modifiers['Bevel'].segments = 1
+    bevel = obj.modifiers.new('Bevel', 'BEVEL')
+    bevel.width = 0.015
+    bevel.segments = 1
 
     return obj
 
 
 def create_black_hole_core(name, radius=0.35):
     """Create a black hole core."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=radius, segments=64, ring_count=32, location=(0, 0, 0))
-    obj = bpy.context.active_object
-    obj.name = name
-    bpy.ops.object.shade_smooth()
+    obj = _new_mesh_object(name, _uv_sphere_part(radius, 64, 32))
+    _shade_smooth(obj)
     return obj
 
 
 # Frame creation functions
 def create_sunburst_frame(name, radius=0.7, ray_count=12):
     """Create a sunburst frame."""
-    objects = []
-
-    bpy.ops.mesh.primitive_torus_add(major_radius=radius, minor_radius=0.03, major_segments=64, minor_segments=16, location=(0, 0, 0))
-    ring = bpy.context.active_object
-    ring.name = name + "_ring"
-    objects.append(ring)
-
-    for i in range(ray_count):
-        angle = (2 * math.pi * i) / ray_count
-        bpy.ops.mesh.primitive_cone_add(vertices=4, radius1=0.05, radius2=0, depth=0.25, location=(0, 0, 0))
-        ray = bpy.context.active_object
-        ray.name = f"{name}_ray_{i}"
-        ray.rotation_euler = (0, math.radians(90), angle)
-        ray.location = (math.cos(angle) * (radius + 0.1), math.sin(angle) * (radius + 0.1), 0)
-        objects.append(ray)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    frame = bpy.context.active_object
-    frame.name = name
-    return frame
+    angles = np.arange(ray_count) * (2 * np.pi / ray_count)
+    locations = np.column_stack((np.cos(angles) * (radius + 0.1), np.sin(angles) * (radius + 0.1), np.zeros(ray_count)))
+    rotations = np.column_stack((np.zeros(ray_count), np.full(ray_count, np.pi / 2), angles))
+
+    ring = _torus_buffers(radius, 0.03, 64, 16)
+    rays = _instance_parts(_cone_part(4, 0.05, 0.25), locations, rotations)
+    return _new_mesh_object(name, _merge_parts([ring, rays]))
 
 
 def create_wave_rings(name, base_radius=0.6, count=3):
     """Create wave rings."""
-    objects = []
-
-    for i in range(count):
-        radius = base_radius + (i * 0.15)
-        thickness = 0.02 - (i * 0.005)
-
-        bpy.ops.mesh.primitive_torus_add(
-            major_radius=radius,
-            minor_radius=thickness,
-            major_segments=64,
-            minor_segments=12,
-            location=(0, 0, i * 0.05 - 0.05)
-        )
-        ring = bpy.context.active_object
-        ring.name = f"{name}_ring_{i}"
-
-        bpy.ops.object.modifier_add(type='WAVE')
-        wave = ring.modifiers['Wave']
-        wave.use_normal = True
-        wave.height = 0.03
-        wave.width = 0.3
-        wave.narrowness = 1.5
-        wave.speed = 0
-
-        objects.append(ring)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    frame = bpy.context.active_object
-    frame.name = name
+    # Rings stack upwards from the first ring, which anchors the object at z = -0.05
+    parts = [
+        _instance_parts(_torus_buffers(base_radius + (i * 0.15), 0.02 - (i * 0.005), 64, 12), (0, 0, i * 0.05), (0, 0, 0))
+        for i in range(count)
+    ]
+    frame = _new_mesh_object(name, _merge_parts(parts))
+    frame.location = (0, 0, -0.05)
+
+    wave = frame.modifiers.new('Wave', 'WAVE')
+    wave.use_normal = True
+    wave.height = 0.03
+    wave.width = 0.3
+    wave.narrowness = 1.5
+    wave.speed = 0
+
     return frame
 
 
 def create_lightning_cage(name, radius=0.65, segments=8):
     """Create a lightning cage frame."""
-    objects = []
-
-    for i in range(segments):
-        angle = (2 * math.pi * i) / segments
-        verts = []
-        edges = []
-
-        for j in range(8):
-            z = -0.5 + (j * 0.15)
-            offset = 0.03 * (1 if j % 2 == 0 else -1)
-            x = math.cos(angle) * (radius + offset)
-            y = math.sin(angle) * (radius + offset)
-            verts.append((x, y, z))
-            if j > 0:
-                edges.append((j-1, j))
-
-        mesh = bpy.data.meshes.new(f"{name}_bolt_{i}")
-        mesh.from_pydata(verts, edges, [])
-        bolt = bpy.data.objects.new(f"{name}_bolt_{i}", mesh)
-        bpy.context.collection.objects.link(bolt)
-
-        bpy.context.view_layer.objects.active = bolt
-        bolt.select_set(True)
-        bpy.ops.object.convert(target='CURVE')
-        bolt.data.bevel_depth = 0.015
-        bolt.data.bevel_resolution = 4
-        bpy.ops.object.convert(target='MESH')
-
-        objects.append(bolt)
-
-    for z_pos in [-0.5, 0.5]:
-        bpy.ops.mesh.primitive_torus_add(major_radius=radius, minor_radius=0.02, major_segments=48, minor_segments=8, location=(0, 0, z_pos))
-        ring = bpy.context.active_object
-        objects.append(ring)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    frame = bpy.context.active_object
-    frame.name = name
-    return frame
+    # Zigzag bolts: 8 points per bolt alternating 0.03 in and out of the cage radius
+    angles = np.arange(segments) * (2 * np.pi / segments)
+    offsets = radius + 0.03 * np.where(np.arange(8) % 2 == 0, 1.0, -1.0)
+    paths = np.stack((
+        np.cos(angles)[:, None] * offsets[None, :],
+        np.sin(angles)[:, None] * offsets[None, :],
+        np.broadcast_to(-0.5 + np.arange(8) * 0.15, (segments, 8)),
+    ), axis=-1)
+
+    # 0.015 bevel depth at bevel resolution 4 gives a 12-sided cross-section
+    bolts = _polyline_tubes(paths, 0.015, 12)
+    rings = [
+        _instance_parts(_torus_buffers(radius, 0.02, 48, 8), (0, 0, z_pos), (0, 0, 0))
+        for z_pos in (-0.5, 0.5)
+    ]
+    return _new_mesh_object(name, _merge_parts([bolts, *rings]))
 
 
 def create_snowflake_frame(name, radius=0.65):
     """Create a snowflake frame."""
-    objects = []
-
-    for i in range(6):
-        angle = (2 * math.pi * i) / 6
-
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.02, depth=radius*1.5, location=(0, 0, 0))
-        arm = bpy.context.active_object
-        arm.rotation_euler = (0, math.radians(90), angle)
-        arm.location = (math.cos(angle) * radius * 0.4, math.sin(angle) * radius * 0.4, 0)
-        objects.append(arm)
-
-        for j in [-1, 1]:
-            branch_angle = angle + (j * math.radians(60))
-            bpy.ops.mesh.primitive_cylinder_add(radius=0.015, depth=radius*0.5, location=(0, 0, 0))
-            branch = bpy.context.active_object
-            branch.rotation_euler = (0, math.radians(90), branch_angle)
-            dist = radius * 0.5
-            branch.location = (math.cos(angle) * dist, math.sin(angle) * dist, 0)
-            objects.append(branch)
-
-    bpy.ops.mesh.primitive_cylinder_add(vertices=6, radius=0.15, depth=0.04, location=(0, 0, 0))
-    center = bpy.context.active_object
-    objects.append(center)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    frame = bpy.context.active_object
-    frame.name = name
-    return frame
+    angles = np.arange(6) * (2 * np.pi / 6)
+    zeros = np.zeros(6)
+    tilt = np.full(6, np.pi / 2)
+
+    arms = _instance_parts(
+        _cylinder_part(32, 0.02, radius * 1.5),
+        np.column_stack((np.cos(angles) * radius * 0.4, np.sin(angles) * radius * 0.4, zeros)),
+        np.column_stack((zeros, tilt, angles)),
+    )
+
+    # Two branches per arm, both rooted at half the radius and splayed by +-60 degrees
+    branch_locations = np.column_stack((np.cos(angles) * radius * 0.5, np.sin(angles) * radius * 0.5, zeros))
+    branches = [
+        _instance_parts(
+            _cylinder_part(32, 0.015, radius * 0.5),
+            branch_locations,
+            np.column_stack((zeros, tilt, angles + side * np.pi / 3)),
+        )
+        for side in (-1, 1)
+    ]
+
+    center = _cylinder_part(6, 0.15, 0.04)
+    return _new_mesh_object(name, _merge_parts([arms, *branches, center]))
 
 
 def create_flowing_ribbons(name, radius=0.6, ribbon_count=5):
     """Create flowing aurora ribbons."""
-    objects = []
-
-    for i in range(ribbon_count):
-        bpy.ops.curve.primitive_bezier_circle_add(radius=radius + (i * 0.05), location=(0, 0, i * 0.08 - 0.16))
-        ribbon = bpy.context.active_object
-        ribbon.name = f"{name}_ribbon_{i}"
-        ribbon.data.bevel_depth = 0.015
-        ribbon.data.bevel_resolution = 3
-        ribbon.rotation_euler = (math.radians(10 * i), math.radians(5 * i), 0)
-        objects.append(ribbon)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.convert(target='MESH')
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    frame = bpy.context.active_object
-    frame.name = name
+    # Ribbons stack upwards from the first ribbon, which anchors the object at z = -0.16
+    # 0.015 bevel depth at bevel resolution 3 gives a 10-sided cross-section
+    parts = [
+        _instance_parts(
+            _closed_ring_tube(_bezier_circle_path(radius + (i * 0.05)), 0.015, 10),
+            (0, 0, i * 0.08),
+            (math.radians(10 * i), math.radians(5 * i), 0),
+        )
+        for i in range(ribbon_count)
+    ]
+    frame = _new_mesh_object(name, _merge_parts(parts))
+    frame.location = (0, 0, -0.16)
+    _shade_smooth(frame)
     return frame
 
 
 def create_hieroglyph_ring(name, radius=0.65):
     """Create ancient ring with patterns."""
-    bpy.ops.mesh.primitive_torus_add(major_radius=radius, minor_radius=0.04, major_segments=64, minor_segments=16, location=(0, 0, 0))
-    ring = bpy.context.active_object
-    ring.name = name
-
-    bpy.ops.mesh.primitive_cone_add(vertices=3, radius1=0.03, radius2=0, depth=0.06, location=(radius, 0, 0))
-    triangle = bpy.context.active_object
-
-    bpy.ops.object.modifier_add(type='ARRAY')
-    triangle.modifiers['Array'].use_relative_offset = False
-    triangle.modifiers['Array'].use_object_offset = True
+    # 12 small triangles around the ring, each stepped 30 degrees about the Z axis
+    angles = np.arange(12) * (np.pi / 6)
+    locations = np.column_stack((np.cos(angles) * radius, np.sin(angles) * radius, np.zeros(12)))
+    rotations = np.column_stack((np.zeros(12), np.zeros(12), angles))
 
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    empty = bpy.context.active_object
-    empty.rotation_euler = (0, 0, math.radians(30))
-
-    triangle.modifiers['Array'].offset_object = empty
-    triangle.modifiers['Array'].count = 12
-
-    bpy.context.view_layer.objects.active = triangle
-    bpy.ops.object.modifier_apply(modifier='Array')
-
-    ring.select_set(True)
-    triangle.select_set(True)
-    bpy.context.view_layer.objects.active = ring
-    bpy.ops.object.join()
-
-    bpy.data.objects.remove(empty)
-
-    return ring
+    ring = _torus_buffers(radius, 0.04, 64, 16)
+    triangles = _instance_parts(_cone_part(3, 0.03, 0.06), locations, rotations)
+    return _new_mesh_object(name, _merge_parts([ring, triangles]))
 
 
 def create_corona_ring(name, radius=0.7):
     """Create a corona ring for eclipse."""
-    objects = []
-
-    bpy.ops.mesh.primitive_torus_add(major_radius=radius*0.8, minor_radius=0.02, major_segments=64, minor_segments=12, location=(0, 0, 0))
-    inner = bpy.context.active_object
-    objects.append(inner)
-
-    bpy.ops.mesh.primitive_torus_add(major_radius=radius, minor_radius=0.05, major_segments=64, minor_segments=16, location=(0, 0, 0))
-    outer = bpy.context.active_object
-    outer.name = name + "_glow"
-    objects.append(outer)
-
-    for i in range(16):
-        angle = (2 * math.pi * i) / 16
-        flare_length = 0.15 + (0.1 * (i % 3))
-
-        bpy.ops.mesh.primitive_cone_add(vertices=8, radius1=0.03, radius2=0, depth=flare_length, location=(0, 0, 0))
-        flare = bpy.context.active_object
-        flare.rotation_euler = (0, math.radians(90), angle)
-        flare.location = (math.cos(angle) * (radius + flare_length/2), math.sin(angle) * (radius + flare_length/2), 0)
-        objects.append(flare)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    frame = bpy.context.active_object
-    frame.name = name
-    return frame
+    parts = [
+        _torus_buffers(radius * 0.8, 0.02, 64, 12),
+        _torus_buffers(radius, 0.05, 64, 16),
+    ]
+
+    # 16 radial flares cycling through three lengths; one cone template per length
+    angles = np.arange(16) * (2 * np.pi / 16)
+    flare_lengths = 0.15 + 0.1 * (np.arange(16) % 3)
+    for length_idx in range(3):
+        angle = angles[length_idx::3]
+        flare_length = flare_lengths[length_idx]
+        offset = radius + flare_length / 2
+        locations = np.column_stack((np.cos(angle) * offset, np.sin(angle) * offset, np.zeros(len(angle))))
+        rotations = np.column_stack((np.zeros(len(angle)), np.full(len(angle), np.pi / 2), angle))
+        parts.append(_instance_parts(_cone_part(8, 0.03, flare_length), locations, rotations))
+
+    return _new_mesh_object(name, _merge_parts(parts))
 
 
 def create_base_platform(name, style="default"):
     """Create base platform."""
     if style == "crystal":
-        bpy.ops.mesh.primitive_cylinder_add(vertices=8, radius=0.55, depth=0.08, location=(0, 0, -0.65))
+        part = _cylinder_part(8, 0.55, 0.08)
     elif style == "ancient":
-        bpy.ops.mesh.primitive_cylinder_add(vertices=4, radius=0.6, depth=0.1, location=(0, 0, -0.65))
+        part = _cylinder_part(4, 0.6, 0.1)
     else:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.55, depth=0.08, location=(0, 0, -0.65))
+        part = _cylinder_part(32, 0.55, 0.08)
 
-    base = bpy.context.active_object
-    base.name = name
+    base = _new_mesh_object(name, part)
+    base.location = (0, 0, -0.65)
 
-    bpy.ops.object.modifier_add(type='BEVEL')
-    base.modifiers['Bevel'].width = 0.015
-    base.modifiers['Bevel'].segments = 2
+    bevel = base.modifiers.new('Bevel', 'BEVEL')
+    bevel.width = 0.015
+    bevel.segments = 2
 
     return base
 
 
 def create_floating_particles(name, count=30, radius_range=(0.6, 1.0), size=0.015):
     """Create floating particles."""
-    import random
-    random.seed(42)
-    objects = []
-
-    for i in range(count):
-        theta = random.uniform(0, 2 * math.pi)
-        phi = random.uniform(0, math.pi)
-        r = random.uniform(radius_range[0], radius_range[1])
-
-        x = r * math.sin(phi) * math.cos(theta)
-        y = r * math.sin(phi) * math.sin(theta)
-        z = r * math.cos(phi) - 0.2
-
-        particle_size = size * random.uniform(0.5, 1.5)
-
-        bpy.ops.mesh.primitive_ico_sphere_add(radius=particle_size, subdivisions=1, location=(x, y, z))
-        particle = bpy.context.active_object
-        particle.name = f"{name}_particle_{i}"
-        objects.append(particle)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    particles = bpy.context.active_object
-    particles.name = name
+    # Same seeded draw order as the per-particle loop: theta, phi, r, size scale
+    rng = random.Random(42)
+    u = np.array([rng.random() for _ in range(count * 4)]).reshape(count, 4)
+    theta = 2 * math.pi * u[:, 0]
+    phi = math.pi * u[:, 1]
+    r = radius_range[0] + (radius_range[1] - radius_range[0]) * u[:, 2]
+    sizes = size * (0.5 + u[:, 3])
+
+    positions = np.column_stack((
+        r * np.sin(phi) * np.cos(theta),
+        r * np.sin(phi) * np.sin(theta),
+        r * np.cos(phi) - 0.2,
+    ))
+
+    # Unit icosahedron scaled per particle, relative to the first particle, which anchors the object
+    verts, loop_verts, loop_starts = _ico_sphere_part(1.0, 1)
+    placed = verts[None, :, :] * sizes[:, None, None] + (positions - positions[0])[:, None, :]
+    particles = _new_mesh_object(name, _merge_parts([(v, loop_verts, loop_starts) for v in placed]))
+    particles.location = positions[0]
     return particles
 
 
 def create_energy_rings(name, count=3, base_radius=0.45):
     """Create energy orbit rings."""
-    objects = []
-
-    for i in range(count):
-        radius = base_radius + (i * 0.05)
-
-        bpy.ops.mesh.primitive_torus_add(
-            major_radius=radius,
-            minor_radius=0.005,
-            major_segments=64,
-            minor_segments=8,
-            location=(0, 0, 0)
+    parts = [
+        _instance_parts(
+            _torus_buffers(base_radius + (i * 0.05), 0.005, 64, 8),
+            (0, 0, 0),
+            (math.radians(30 * i), math.radians(45 + 20 * i), math.radians(15 * i)),
         )
-        ring = bpy.context.active_object
-        ring.name = f"{name}_ring_{i}"
-        ring.rotation_euler = (math.radians(30 * i), math.radians(45 + 20 * i), math.radians(15 * i))
-        objects.append(ring)
-
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects:
-        obj.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-
-    rings = bpy.context.active_object
-    rings.name = name
-    return rings
+        for i in range(count)
+    ]
+    return _new_mesh_object(name, _merge_parts(parts))
 
 
 # ============================================================
 #                    STUDIO LIGHTING SETUP
 # ============================================================
 
-def setup_studio_lighting(house_config, collections):
-    """Setup professional studio lighting with emission planes."""
-    base_lighting = BASE_CONFIG["lighting"]
-
-    # KEY light
-    key_cfg = base_lighting["key"].copy()
-    key_strength = house_config.get("key_strength", key_cfg["strength"])
-    create_emission_plane(
-        "Light_Key",
-        key_cfg["size"],
-        key_strength,
-        key_cfg["color"],
-        key_cfg["location"],
-        key_cfg["rotation"],
-        collections
-    )
+# Shared studio planes, created once per session and retuned per house
+_BASE_LIGHT_NAMES = {
+    "key": "Light_Key",
+    "fill": "Light_Fill",
+    "rim": "Light_Rim",
+    "top_accent": "Light_TopAccent",
+}
 
-    # FILL light
-    fill_cfg = base_lighting["fill"].copy()
-    fill_strength = house_config.get("fill_strength", fill_cfg["strength"])
-    fill_color = house_config.get("fill_color", fill_cfg["color"])
-    create_emission_plane(
-        "Light_Fill",
-        fill_cfg["size"],
-        fill_strength,
-        fill_color,
-        fill_cfg["location"],
-        fill_cfg["rotation"],
-        collections
+# (light, HouseCfg strength attribute, HouseCfg color attribute, base color) for the per-house
+# tunable planes; a None color attribute keeps the base color
+_BASE_LIGHT_OVERRIDES = tuple(
+    (light, strength_attr, color_attr, _LIGHTING_CFG[light]["color"])
+    for light, strength_attr, color_attr in (
+        ("key", "key_strength", None),
+        ("fill", "fill_strength", "fill_color"),
+        ("rim", "rim_strength", "rim_color"),
     )
+)
+
+
+# Base lights whose materials are retuned per house (and Light_Key per token by
+# render_token.py); each keeps a material of its own
+_RETUNED_BASE_LIGHTS = frozenset(light for light, _, _, _ in _BASE_LIGHT_OVERRIDES)
+
+
+def create_base_lights(collections):
+    """Create the key/fill/rim/accent emission planes shared by every house."""
+    base_matrices = _base_light_matrices()
+    lights_coll = collections['Lights']
+    return {
+        light: create_emission_plane(
+            name,
+            _LIGHTING_CFG[light]["strength"],
+            _LIGHTING_CFG[light]["color"],
+            base_matrices[light],
+            lights_coll,
+            shared_material=light not in _RETUNED_BASE_LIGHTS,
+        )
+        for light, name in _BASE_LIGHT_NAMES.items()
+    }
 
-    # RIM light
-    rim_cfg = base_lighting["rim"].copy()
-    rim_strength = house_config.get("rim_strength", rim_cfg["strength"])
-    rim_color = house_config.get("rim_color", rim_cfg["color"])
-    create_emission_plane(
-        "Light_Rim",
-        rim_cfg["size"],
-        rim_strength,
-        rim_color,
-        rim_cfg["location"],
-        rim_cfg["rotation"],
-        collections
-    )
 
-    # TOP ACCENT
-    accent_cfg = base_lighting["top_accent"]
-    create_emission_plane(
-        "Light_TopAccent",
-        accent_cfg["size"],
-        accent_cfg["strength"],
-        accent_cfg["color"],
-        accent_cfg["location"],
-        accent_cfg["rotation"],
-        collections
+def apply_base_light_overrides(base_lights, house_config):
+    """Retune the key/fill/rim materials in place for one house; each light owns its material."""
+    for light, strength_attr, color_attr, base_color in _BASE_LIGHT_OVERRIDES:
+        strength = getattr(house_config, strength_attr)
+        color = getattr(house_config, color_attr) if color_attr else base_color
+
+        mat = base_lights[light].material_slots[0].material
+        emission = mat.node_tree.nodes['emission']
+        emission.inputs['Color'].default_value = (*color, 1.0)
+        emission.inputs['Strength'].default_value = strength
+
+
+def _make_plane_light(light_def, matrix, rot_rad, lights_coll):
+    """Emission plane signature light."""
+    create_emission_plane(light_def.name, light_def.strength, light_def.color, matrix, lights_coll)
+
+
+def _make_ring_light(light_def, matrix, rot_rad, lights_coll):
+    """Emission ring signature light."""
+    create_emission_ring(
+        light_def.name,
+        light_def.radius,
+        light_def.tube_radius,
+        light_def.strength,
+        light_def.color,
+        matrix,
+        lights_coll
     )
 
-    # House-specific light signature
+
+def _make_area_light(light_def, matrix, rot_rad, lights_coll):
+    """Area lamp signature light; size is a normalized (x, y) pair."""
+    light_data = bpy.data.lights.new(light_def.name, type='AREA')
+    light_data.size, light_data.size_y = light_def.size
+    light_data.energy = light_def.strength
+    light_data.color = light_def.color
+    light = bpy.data.objects.new(light_def.name, light_data)
+    light.location = light_def.location
+    light.rotation_euler = rot_rad
+    lights_coll.objects.link(light)
+
+
+def _make_point_light(light_def, matrix, rot_rad, lights_coll):
+    """Point lamp signature light; size[0] is the soft shadow radius."""
+    light_data = bpy.data.lights.new(light_def.name, type='POINT')
+    light_data.energy = light_def.strength
+    light_data.color = light_def.color
+    if light_def.size is not None:
+        light_data.shadow_soft_size = light_def.size[0]
+    light = bpy.data.objects.new(light_def.name, light_data)
+    light.location = light_def.location
+    lights_coll.objects.link(light)
+
+
+# light_signature type -> builder(light_def, matrix, rot_rad, lights_coll)
+_LIGHT_DISPATCH = {
+    "EMISSION_PLANE": _make_plane_light,
+    "EMISSION_RING": _make_ring_light,
+    "AREA": _make_area_light,
+    "POINT": _make_point_light,
+}
+
+
+def setup_light_signature(house_name, house_config, collections):
+    """Add the house-specific light signature next to the shared studio planes."""
+    lights_coll = collections['Lights']
+
     if "light_signature" in house_config:
-        for light_def in house_config["light_signature"]:
-            if light_def["type"] == "EMISSION_PLANE":
-                create_emission_plane(
-                    light_def["name"],
-                    light_def["size"],
-                    light_def["strength"],
-                    light_def["color"],
-                    light_def["location"],
-                    light_def["rotation"],
-                    collections
-                )
-            elif light_def["type"] == "EMISSION_RING":
-                create_emission_ring(
-                    light_def["name"],
-                    light_def["radius"],
-                    light_def["tube_radius"],
-                    light_def["strength"],
-                    light_def["color"],
-                    light_def["location"],
-                    light_def["rotation"],
-                    collections
-                )
-            elif light_def["type"] == "AREA":
-                bpy.ops.object.light_add(type='AREA', location=light_def["location"])
-                light = bpy.context.active_object
-                light.name = light_def["name"]
-                if isinstance(light_def["size"], tuple):
-                    light.data.size = light_def["size"][0]
-                    light.data.size_y = light_def["size"][1]
-                else:
-                    light.data.size = light_def["size"]
-                light.data.energy = light_def["strength"]
-                light.data.color = light_def["color"]
-                if "rotation" in light_def:
-                    light.rotation_euler = tuple(math.radians(r) for r in light_def["rotation"])
-                collections['Lights'].objects.link(light)
-                safe_unlink_from_scene(light)
-            elif light_def["type"] == "POINT":
-                bpy.ops.object.light_add(type='POINT', location=light_def["location"])
-                light = bpy.context.active_object
-                light.name = light_def["name"]
-                light.data.energy = light_def["strength"]
-                light.data.color = light_def["color"]
-                if "size" in light_def:
-                    light.data.shadow_soft_size = light_def["size"]
-                collections['Lights'].objects.link(light)
-                safe_unlink_from_scene(light)
+        house_arrays = get_house_arrays(house_name)
+        # matrix_world reads array input column-major, so hand it the transposes
+        house_matrices = house_arrays["matrix"].transpose(0, 2, 1)
+        for light_def, matrix, rot_rad in zip(house_config.light_signature, house_matrices, house_arrays["rot_rad"]):
+            _LIGHT_DISPATCH[light_def.type](light_def, matrix, rot_rad, lights_coll)
 
 
 # ============================================================
 #                    CAMERA SETUP
 # ============================================================
 
+def _camera_matrix():
+    """Return the camera world matrix from the preset, transposed for matrix_world."""
+    matrix = _compose_matrices(
+        np.array([_CAMERA_CFG["location"]], dtype=np.float32),
+        np.deg2rad([_CAMERA_CFG["rotation"]]),
+        np.ones((1, 2)),
+    )[0]
+    # matrix_world reads array input column-major
+    return matrix.T
+
+
+# Preset camera transform, resolved once at import
+_CAMERA_MATRIX = _camera_matrix()
+
+
 def create_camera(collections):
     """Create camera with professional settings."""
-    cam_cfg = BASE_CONFIG["camera"]
-
-    bpy.ops.object.camera_add(location=cam_cfg["location"])
-    camera = bpy.context.active_object
-    camera.name = "CAM_MAIN"
-    camera.rotation_euler = (
-        math.radians(cam_cfg["rotation"][0]),
-        math.radians(cam_cfg["rotation"][1]),
-        math.radians(cam_cfg["rotation"][2])
-    )
+    cam_cfg = _CAMERA_CFG
+
+    camera = bpy.data.objects.new("CAM_MAIN", bpy.data.cameras.new("CAM_MAIN"))
+    camera.matrix_world = _CAMERA_MATRIX
 
     camera.data.lens = cam_cfg["focal_length"]
     camera.data.sensor_width = cam_cfg["sensor_width"]
@@ -1489,10 +2160,8 @@ def create_camera(collections):
     camera.data.dof.focus_distance = 1.25  # Focus on core
     camera.data.dof.aperture_fstop = cam_cfg["f_stop"]
 
-    bpy.context.scene.camera = camera
-
     collections['Camera'].objects.link(camera)
-    safe_unlink_from_scene(camera)
+    bpy.context.scene.camera = camera
 
     return camera
 
@@ -1501,62 +2170,47 @@ def create_camera(collections):
 #                    WORLD SETUP
 # ============================================================
 
-def setup_world(house_config):
-    """Setup world with gradient background."""
-    world = bpy.context.scene.world
-    if world is None:
-        world = bpy.data.worlds.new("World")
-        bpy.context.scene.world = world
+# Hidden fake-user world holding the gradient background graph, copied per scene
+_WORLD_TEMPLATE_NAME = ".World_Template"
+
+# Gradient mapping rotation (radians), stands the spherical gradient upright
+_WORLD_MAPPING_ROTATION = (math.radians(90), 0.0, 0.0)
+
 
-    world.use_nodes = True
-    nodes = world.node_tree.nodes
-    links = world.node_tree.links
+def _get_world_template():
+    """Return the template world with the studio gradient background, building it once per session."""
+    template = bpy.data.worlds.get(_WORLD_TEMPLATE_NAME)
+    if template is not None:
+        return template
+
+    template = bpy.data.worlds.new(_WORLD_TEMPLATE_NAME)
+    template.use_fake_user = True
+    template.use_nodes = True
+    nodes = template.node_tree.nodes
+    links = template.node_tree.links
     nodes.clear()
 
     # Texture coordinate
-    tex_coord = nodes.new('ShaderNodeTexCoord')
-    tex_coord.location = (-800, 0)
+    tex_coord = _new_node(nodes, 'ShaderNodeTexCoord', 'tex_coord', (-800, 0))
 
     # Mapping for rotation
-    mapping = nodes.new('ShaderNodeMapping')
-    mapping.location = (-600, 0)
-    mapping.inputs['Rotation'].default_value = (math.radians(90), 0, 0)
+    mapping = _new_node(nodes, 'ShaderNodeMapping', 'mapping', (-600, 0))
+    mapping.inputs['Rotation'].default_value = _WORLD_MAPPING_ROTATION
 
     # Gradient texture
-    gradient = nodes.new('ShaderNodeTexGradient')
-    gradient.location = (-400, 0)
+    gradient = _new_node(nodes, 'ShaderNodeTexGradient', 'gradient', (-400, 0))
     gradient.gradient_type = 'SPHERICAL'
 
-    # Color ramp with 3 stops
-    color_ramp = nodes.new('ShaderNodeValToRGB')
-    color_ramp.location = (-100, 0)
-
-    world_cfg = BASE_CONFIG["world"]
-
-    # Add middle stop
-    color_ramp.color_ramp.elements.new(0.55)
-
-    # Set colors from config
-    color_ramp.color_ramp.elements[0].position = world_cfg["gradient_colors"][0][0]
-    color_ramp.color_ramp.elements[0].color = (*world_cfg["gradient_colors"][0][1], 1.0)
-
-    color_ramp.color_ramp.elements[1].position = world_cfg["gradient_colors"][1][0]
-    color_ramp.color_ramp.elements[1].color = (*world_cfg["gradient_colors"][1][1], 1.0)
-
-    color_ramp.color_ramp.elements[2].position = world_cfg["gradient_colors"][2][0]
-    color_ramp.color_ramp.elements[2].color = (*world_cfg["gradient_colors"][2][1], 1.0)
+    # Color ramp with 3 stops from the precomputed gradient arrays
+    color_ramp = _new_node(nodes, 'ShaderNodeValToRGB', 'color_ramp', (-100, 0))
+    apply_color_ramp(color_ramp.color_ramp, *_WORLD_GRADIENT)
 
     # Background node
-    bg = nodes.new('ShaderNodeBackground')
-    bg.location = (200, 0)
-
-    # Get world strength from house config or base
-    world_strength = house_config.get("world_strength", world_cfg["strength"])
-    bg.inputs['Strength'].default_value = world_strength
+    bg = _new_node(nodes, 'ShaderNodeBackground', 'background', (200, 0))
+    bg.inputs['Strength'].default_value = _WORLD_STRENGTH
 
     # Output
-    output = nodes.new('ShaderNodeOutputWorld')
-    output.location = (400, 0)
+    output = _new_node(nodes, 'ShaderNodeOutputWorld', 'output', (400, 0))
 
     # Connect
     links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
@@ -1564,46 +2218,56 @@ def setup_world(house_config):
     links.new(gradient.outputs['Fac'], color_ramp.inputs['Fac'])
     links.new(color_ramp.outputs['Color'], bg.inputs['Color'])
     links.new(bg.outputs['Background'], output.inputs['Surface'])
+    return template
+
+
+def setup_world():
+    """Setup world with gradient background at base strength; return the Background node."""
+    scene = bpy.context.scene
+    previous = scene.world
+    if previous is not None and previous.users == 1:
+        bpy.data.worlds.remove(previous)
+
+    world = _get_world_template().copy()
+    world.use_fake_user = False
+    world.name = "World"
+    scene.world = world
+
+    return world.node_tree.nodes['background']
 
 
 # ============================================================
 #                    VOLUME/ATMOSPHERE SETUP
 # ============================================================
 
-def setup_atmosphere(house_config, collections):
-    """Setup volumetric atmosphere if enabled."""
-    if not house_config.get("volume_enabled", False):
-        return
+def _build_volume_template(nodes, links):
+    """Volume scatter feeding the material volume output."""
+    output = _new_node(nodes, 'ShaderNodeOutputMaterial', 'output', (400, 0))
 
-    # Create volume cube encompassing the scene
-    bpy.ops.mesh.primitive_cube_add(size=4.0, location=(0, 0, 0))
-    volume_cube = bpy.context.active_object
-    volume_cube.name = "Atmosphere_Volume"
+    volume_scatter = _new_node(nodes, 'ShaderNodeVolumeScatter', 'volume_scatter', (100, 100))
 
-    # Create volume material
-    mat = bpy.data.materials.new(name="MAT_Atmosphere")
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+    links.new(volume_scatter.outputs['Volume'], output.inputs['Volume'])
 
-    output = nodes.new('ShaderNodeOutputMaterial')
-    output.location = (400, 0)
 
-    volume_scatter = nodes.new('ShaderNodeVolumeScatter')
-    volume_scatter.location = (100, 100)
-    volume_scatter.inputs['Density'].default_value = house_config.get("volume_density", 0.02)
-    volume_scatter.inputs['Anisotropy'].default_value = house_config.get("volume_anisotropy", 0.3)
+def setup_atmosphere(house_config, collections):
+    """Setup volumetric atmosphere if enabled."""
+    if not house_config.volume_enabled:
+        return
 
-    vol_color = house_config.get("volume_color", (1.0, 1.0, 1.0))
-    volume_scatter.inputs['Color'].default_value = (*vol_color, 1.0)
+    # Volume cube encompassing the scene, on the shared cube mesh
+    mesh = _get_shared_light_mesh("volume_cube", "Atmosphere_Volume", _VOLUME_CUBE_BUFFERS)
+    volume_cube = bpy.data.objects.new("Atmosphere_Volume", mesh)
 
-    links.new(volume_scatter.outputs['Volume'], output.inputs['Volume'])
+    # Volume material cloned from the template, only the scatter inputs vary per house
+    mat = _material_from_template("volume", _build_volume_template, "MAT_Atmosphere")
+    volume_scatter = mat.node_tree.nodes['volume_scatter']
+    volume_scatter.inputs['Density'].default_value = house_config.volume_density
+    volume_scatter.inputs['Anisotropy'].default_value = house_config.volume_anisotropy
+    volume_scatter.inputs['Color'].default_value = (*house_config.volume_color, 1.0)
 
-    volume_cube.data.materials.append(mat)
+    _link_object_material(volume_cube, mat)
 
     collections['Volume'].objects.link(volume_cube)
-    safe_unlink_from_scene(volume_cube)
 
 
 # ============================================================
@@ -1615,40 +2279,19 @@ def setup_render_settings():
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
 
-    cycles_cfg = BASE_CONFIG["cycles"]
     cycles = scene.cycles
-
-    cycles.device = 'GPU'
-    cycles.samples = cycles_cfg["samples"]
-    cycles.use_denoising = cycles_cfg["denoise"]
-    cycles.denoiser = cycles_cfg["denoiser"]
-    cycles.use_adaptive_sampling = True
-    cycles.adaptive_threshold = cycles_cfg["noise_threshold"]
-
-    cycles.max_bounces = cycles_cfg["max_bounces"]
-    cycles.diffuse_bounces = cycles_cfg["diffuse_bounces"]
-    cycles.glossy_bounces = cycles_cfg["glossy_bounces"]
-    cycles.transmission_bounces = cycles_cfg["transmission_bounces"]
-    cycles.volume_bounces = cycles_cfg["volume_bounces"]
-    cycles.transparent_max_bounces = cycles_cfg["transparent_max_bounces"]
-
-    cycles.sample_clamp_indirect = cycles_cfg["clamp_indirect"]
-    cycles.blur_glossy = cycles_cfg["filter_glossy"]
-    cycles.caustics_reflective = False
-    cycles.caustics_refractive = False
+    for attr, value in _CYCLES_SETTINGS:
+        setattr(cycles, attr, value)
+    scene.render.use_persistent_data = _CYCLES_CFG["use_persistent_data"]
 
     # Output
-    output_cfg = BASE_CONFIG["output"]
-    scene.render.resolution_x = output_cfg["resolution"][0]
-    scene.render.resolution_y = output_cfg["resolution"][1]
+    scene.render.resolution_x, scene.render.resolution_y = _OUTPUT_CFG["resolution"]
     scene.render.resolution_percentage = 100
 
     # Color management
-    cm_cfg = BASE_CONFIG["color_management"]
-    scene.view_settings.view_transform = cm_cfg["view_transform"]
-    scene.view_settings.look = cm_cfg["look"]
-    scene.view_settings.exposure = cm_cfg["exposure"]
-    scene.view_settings.gamma = cm_cfg["gamma"]
+    view_settings = scene.view_settings
+    for attr, value in _VIEW_SETTINGS:
+        setattr(view_settings, attr, value)
 
     scene.render.film_transparent = False
 
@@ -1657,8 +2300,23 @@ def setup_render_settings():
 #                    COMPOSITOR SETUP
 # ============================================================
 
-def setup_compositor(house_config):
-    """Setup compositor with glare and color curves."""
+def _tint_gain(tint):
+    """Return the very subtle color balance gain for a house tint."""
+    return tuple(1.0 + (channel - 1.0) * 0.05 for channel in tint)
+
+
+# Static compositor chain as (name, node type, location); Image flows from each node to the next
+_COMPOSITOR_CHAIN = (
+    ("render", 'CompositorNodeRLayers', (0, 0)),
+    ("glare", 'CompositorNodeGlare', (250, 0)),
+    ("curves", 'CompositorNodeCurveRGB', (500, 0)),
+    ("color_balance", 'CompositorNodeColorBalance', (750, 0)),
+    ("composite", 'CompositorNodeComposite', (1000, 0)),
+)
+
+
+def setup_compositor():
+    """Setup compositor with base glare and color curves; return the per-house tunable nodes."""
     scene = bpy.context.scene
     scene.use_nodes = True
 
@@ -1667,72 +2325,261 @@ def setup_compositor(house_config):
     links = tree.links
     nodes.clear()
 
-    # Render layers
-    render = nodes.new('CompositorNodeRLayers')
-    render.location = (0, 0)
+    # Render layers -> glare -> curves -> color balance -> composite, from the static table
+    chain = [_new_node(nodes, node_type, name, location) for name, node_type, location in _COMPOSITOR_CHAIN]
+    for upstream, downstream in zip(chain, chain[1:]):
+        links.new(upstream.outputs['Image'], downstream.inputs['Image'])
+    render, glare, curves, color_balance, composite = chain
 
     # Glare/Bloom
-    comp_cfg = BASE_CONFIG["compositor"]
-    glare_mix = house_config.get("glare_mix", comp_cfg["glare_mix"])
-
-    glare = nodes.new('CompositorNodeGlare')
-    glare.location = (250, 0)
+    comp_cfg = _COMPOSITOR_CFG
     glare.glare_type = 'FOG_GLOW'
     glare.quality = 'HIGH'
-    glare.mix = glare_mix
+    glare.mix = _GLARE_MIX
     glare.threshold = comp_cfg["glare_threshold"]
     glare.size = comp_cfg["glare_size"]
 
-    # RGB Curves for subtle S-curve
-    curves = nodes.new('CompositorNodeCurveRGB')
-    curves.location = (500, 0)
     # Subtle S-curve: lift blacks slightly, compress highlights
     curve = curves.mapping.curves[3]  # Combined RGB
     curve.points[0].location = (0.0, 0.02)  # Lift blacks
     curve.points[1].location = (1.0, 0.98)  # Compress whites
     curves.mapping.update()
 
-    # Color balance for house tint
-    tint = house_config.get("tint", (1.0, 1.0, 1.0))
-    color_balance = nodes.new('CompositorNodeColorBalance')
-    color_balance.location = (750, 0)
+    # Color balance for house tint (neutral until apply_house_overrides), very subtle via gain
     color_balance.correction_method = 'LIFT_GAMMA_GAIN'
-    # Very subtle tint via gain
-    color_balance.gain = (
-        1.0 + (tint[0] - 1.0) * 0.05,
-        1.0 + (tint[1] - 1.0) * 0.05,
-        1.0 + (tint[2] - 1.0) * 0.05
-    )
-
-    # Output
-    composite = nodes.new('CompositorNodeComposite')
-    composite.location = (1000, 0)
+    color_balance.gain = _tint_gain((1.0, 1.0, 1.0))
 
-    links.new(render.outputs['Image'], glare.inputs['Image'])
-    links.new(glare.outputs['Image'], curves.inputs['Image'])
-    links.new(curves.outputs['Image'], color_balance.inputs['Image'])
-    links.new(color_balance.outputs['Image'], composite.inputs['Image'])
+    return {"glare": glare, "color_balance": color_balance}
 
 
 # ============================================================
 #                    HOUSE TEMPLATE GENERATION
 # ============================================================
 
-def generate_house_template(house_name, house_config, output_dir):
-    """Generate a complete template for a house."""
+def build_shared_scene(collections):
+    """Build the render settings, world, compositor, camera and studio planes shared by every house."""
+    setup_render_settings()
+    shared = {
+        "world_background": setup_world(),
+        "camera": create_camera(collections),
+        "base_lights": create_base_lights(collections),
+    }
+    shared.update(setup_compositor())
+    # (glare mix, tint) the compositor currently holds
+    shared["compositor_values"] = (_GLARE_MIX, (1.0, 1.0, 1.0))
+    shared["objects"] = frozenset(obj.name for obj in bpy.data.objects)
+    return shared
+
+
+def apply_house_overrides(shared, house_config):
+    """Write one house's world, compositor and studio light values into the shared scene."""
+    shared["world_background"].inputs['Strength'].default_value = house_config.world_strength
+
+    # Skip the compositor when it already holds this glare mix and tint (e.g. base glare, neutral tint)
+    compositor_values = (house_config.glare_mix, tuple(house_config.tint))
+    if compositor_values != shared["compositor_values"]:
+        shared["glare"].mix = house_config.glare_mix
+        shared["color_balance"].gain = _tint_gain(house_config.tint)
+        shared["compositor_values"] = compositor_values
+
+    apply_base_light_overrides(shared["base_lights"], house_config)
+
+
+def _object_datablocks(obj):
+    """Return an object with its data, slot materials and modifier textures."""
+    blocks = {obj, obj.data}
+    blocks.update(slot.material for slot in obj.material_slots)
+    blocks.update(getattr(modifier, "texture", None) for modifier in obj.modifiers)
+    blocks.discard(None)
+    return blocks
+
+
+def remove_house_objects(shared):
+    """Delete one house's objects and the datablocks only they used, keeping the shared scene."""
+    house_objects = [obj for obj in bpy.data.objects if obj.name not in shared["objects"]]
+    kept = set().union(*(_object_datablocks(bpy.data.objects[name]) for name in shared["objects"]))
+    doomed = set().union(*(_object_datablocks(obj) for obj in house_objects)) - kept
+
+    # Forget cached wrappers before their datablocks go away
+    for cache in (_EMISSION_MAT_CACHE, _SHARED_LIGHT_MESHES, _MAT_CACHE, _TEX_CACHE):
+        for key in [key for key, block in cache.items() if block in doomed]:
+            del cache[key]
+
+    # One removal pass instead of a remove() per datablock
+    bpy.data.batch_remove(ids=doomed)
+
+
+def _generate_house_variant(house_name, house_config, output_dir, shared, collections):
+    """Add one house to the shared scene and save it."""
     print(f"\nGenerating template for House {house_name} (v3.0 Professional)...")
 
+    with deferred_scene_updates():
+        apply_house_overrides(shared, house_config)
+        build_house_scene(house_name, house_config, collections)
+
+    # Save
+    output_path = os.path.join(output_dir, f"house_{house_name.lower()}.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=output_path)
+    print(f"  Saved: {output_path}")
+
+    return output_path
+
+
+def _new_shared_scene():
+    """Clear the session and build the shared scene; return (shared, collections)."""
     clear_scene()
     collections = create_collections()
+    with deferred_scene_updates():
+        shared = build_shared_scene(collections)
+    return shared, collections
+
+
+def generate_house_template(house_name, house_config, output_dir):
+    """Generate a complete template for a house."""
+    shared, collections = _new_shared_scene()
+    return _generate_house_variant(house_name, house_config, output_dir, shared, collections)
+
+
+def generate_house_templates(house_names, output_dir):
+    """Generate several houses in one session, building the shared scene only once."""
+    shared, collections = _new_shared_scene()
+    output_paths = []
+    for house_name in house_names:
+        output_paths.append(_generate_house_variant(house_name, HOUSES[house_name], output_dir, shared, collections))
+        remove_house_objects(shared)
+    return output_paths
+
+
+def _glass_core_material(house_name, house_config, roughness):
+    """Clear glass core."""
+    return create_glass_material(
+        f"MAT_Core_{house_name}",
+        house_config.primary_color,
+        transmission=0.95,
+        roughness=roughness,
+        ior=house_config.get("core_ior", 1.45),
+        dispersion=house_config.core_dispersion
+    )
+
+
+def _emissive_glass_core_material(house_name, house_config, roughness):
+    """Glass core with an inner glow."""
+    return create_emissive_glass_material(
+        f"MAT_Core_{house_name}",
+        house_config.primary_color,
+        house_config.emission_color,
+        house_config.emission_strength,
+        roughness=roughness,
+        ior=house_config.get("core_ior", 1.45)
+    )
+
+
+def _frosted_glass_core_material(house_name, house_config, roughness):
+    """Frosted glass core with optional subsurface and edge frost."""
+    return create_frosted_glass_material(
+        f"MAT_Core_{house_name}",
+        house_config.primary_color,
+        roughness=roughness,
+        ior=house_config.get("core_ior", 1.31),
+        subsurface_color=house_config.subsurface_color,
+        subsurface_strength=house_config.subsurface_strength,
+        edge_frost=house_config.edge_frost
+    )
+
+
+def _iridescent_glass_core_material(house_name, house_config, roughness):
+    """Thin-film iridescent glass core."""
+    return create_iridescent_glass_material(
+        f"MAT_Core_{house_name}",
+        house_config.primary_color,
+        roughness=roughness,
+        ior=house_config.get("core_ior", 1.48),
+        irid_strength=house_config.iridescence_strength,
+        irid_shift=house_config.iridescence_shift
+    )
+
+
+def _void_core_material(house_name, house_config, roughness):
+    """Black-hole core with a fresnel corona."""
+    return create_void_material(
+        f"MAT_Core_{house_name}",
+        house_config.core_base_color,
+        house_config.fresnel_emission_color,
+        house_config.fresnel_emission_strength,
+        house_config.fresnel_ior,
+        house_config.fresnel_power
+    )
+
+
+def _default_core_material(house_name, house_config, roughness):
+    """Fallback glass core for unknown core types."""
+    return create_glass_material(
+        f"MAT_Core_{house_name}",
+        house_config.primary_color,
+        transmission=0.95,
+        roughness=roughness,
+        ior=1.45
+    )
+
+
+# core_type -> builder(house_name, house_config, roughness) returning the core material
+_CORE_MAT_BUILDERS = {
+    "glass": _glass_core_material,
+    "emissive_glass": _emissive_glass_core_material,
+    "frosted_glass": _frosted_glass_core_material,
+    "iridescent_glass": _iridescent_glass_core_material,
+    "void": _void_core_material,
+}
+
+
+def _default_geometry():
+    """Fallback faceted sphere and sunburst for unknown houses."""
+    return create_faceted_sphere("Core", radius=0.35), create_sunburst_frame("Frame", radius=0.6)
+
+
+# house name -> builder() returning the themed (core, frame) objects
+_GEOMETRY_BUILDERS = {
+    "CLEAR": lambda: (
+        create_faceted_sphere("Core", radius=0.38, subdivisions=2),
+        create_sunburst_frame("Frame", radius=0.7, ray_count=16),
+    ),
+    "MONSOON": lambda: (
+        create_water_drop_shape("Core", radius=0.35),
+        create_wave_rings("Frame", base_radius=0.6, count=4),
+    ),
+    "THUNDER": lambda: (
+        create_plasma_orb("Core", radius=0.32),
+        create_lightning_cage("Frame", radius=0.6, segments=8),
+    ),
+    "FROST": lambda: (
+        create_ice_crystal("Core", size=0.6),
+        create_snowflake_frame("Frame", radius=0.65),
+    ),
+    "AURORA": lambda: (
+        create_faceted_sphere("Core", radius=0.35, subdivisions=3),
+        create_flowing_ribbons("Frame", radius=0.55, ribbon_count=6),
+    ),
+    "SAND": lambda: (
+        create_pyramid_core("Core", size=0.55),
+        create_hieroglyph_ring("Frame", radius=0.6),
+    ),
+    "ECLIPSE": lambda: (
+        create_black_hole_core("Core", radius=0.3),
+        create_corona_ring("Frame", radius=0.6),
+    ),
+}
+
 
+def build_house_scene(house_name, house_config, collections):
+    """Create the materials, geometry, light signature and atmosphere for a house."""
     # Create materials based on house type
-    if house_config.get("metal_color"):
-        metal_color = house_config["metal_color"]
+    if house_config.metal_color:
+        metal_color = house_config.metal_color
     else:
-        metal_color = tuple(c * 0.8 for c in house_config.get("secondary_color", (0.5, 0.5, 0.5)))
+        metal_color = tuple(c * 0.8 for c in house_config.secondary_color)
 
-    metal_roughness = house_config.get("metal_roughness", (0.15, 0.25))[0]
-    metal_anisotropic = house_config.get("metal_anisotropic", 0.3)
+    metal_roughness = house_config.metal_roughness
+    metal_anisotropic = house_config.metal_anisotropic
 
     frame_mat = create_metallic_material(
         f"MAT_Frame_{house_name}",
@@ -1750,118 +2597,30 @@ def generate_house_template(house_name, house_config, output_dir):
     )
 
     # House-specific core material
-    core_type = house_config.get("core_type", "glass")
-    roughness = house_config.get("core_roughness", (0.02, 0.04))[0]
-
-    if core_type == "glass":
-        core_mat = create_glass_material(
-            f"MAT_Core_{house_name}",
-            house_config.get("primary_color", (1.0, 1.0, 1.0)),
-            transmission=0.95,
-            roughness=roughness,
-            ior=house_config.get("core_ior", 1.45),
-            dispersion=house_config.get("core_dispersion", 0.0)
-        )
-    elif core_type == "emissive_glass":
-        emission_color = house_config.get("emission_color", (1.0, 1.0, 1.0))
-        emission_strength = house_config.get("emission_strength", 5.0)
-        if isinstance(emission_strength, tuple):
-            emission_strength = emission_strength[0]
-        core_mat = create_emissive_glass_material(
-            f"MAT_Core_{house_name}",
-            house_config.get("primary_color", (1.0, 1.0, 1.0)),
-            emission_color,
-            emission_strength,
-            roughness=roughness,
-            ior=house_config.get("core_ior", 1.45)
-        )
-    elif core_type == "frosted_glass":
-        core_mat = create_frosted_glass_material(
-            f"MAT_Core_{house_name}",
-            house_config.get("primary_color", (0.9, 0.95, 1.0)),
-            roughness=roughness,
-            ior=house_config.get("core_ior", 1.31),
-            subsurface_color=house_config.get("subsurface_color"),
-            subsurface_strength=house_config.get("subsurface_strength", 0.08),
-            edge_frost=house_config.get("edge_frost", False)
-        )
-    elif core_type == "iridescent_glass":
-        core_mat = create_iridescent_glass_material(
-            f"MAT_Core_{house_name}",
-            house_config.get("primary_color", (0.9, 0.9, 1.0)),
-            roughness=roughness,
-            ior=house_config.get("core_ior", 1.48),
-            irid_strength=house_config.get("iridescence_strength", 0.15),
-            irid_shift=house_config.get("iridescence_shift", 0.3)
-        )
-    elif core_type == "void":
-        core_mat = create_void_material(
-            f"MAT_Core_{house_name}",
-            house_config.get("core_base_color", (0.02, 0.02, 0.02)),
-            house_config.get("fresnel_emission_color", (1.0, 0.5, 0.2)),
-            house_config.get("fresnel_emission_strength", 8.0),
-            house_config.get("fresnel_ior", 2.5),
-            house_config.get("fresnel_power", 3.0)
-        )
-    else:
-        # Default glass
-        core_mat = create_glass_material(
-            f"MAT_Core_{house_name}",
-            house_config.get("primary_color", (1.0, 1.0, 1.0)),
-            transmission=0.95,
-            roughness=roughness,
-            ior=1.45
-        )
+    core_mat = _CORE_MAT_BUILDERS.get(house_config.core_type, _default_core_material)(
+        house_name, house_config, house_config.core_roughness
+    )
 
     # Create geometry based on house theme
-    if house_name == "CLEAR":
-        core = create_faceted_sphere("Core", radius=0.38, subdivisions=2)
-        frame = create_sunburst_frame("Frame", radius=0.7, ray_count=16)
-    elif house_name == "MONSOON":
-        core = create_water_drop_shape("Core", radius=0.35)
-        frame = create_wave_rings("Frame", base_radius=0.6, count=4)
-    elif house_name == "THUNDER":
-        core = create_plasma_orb("Core", radius=0.32)
-        frame = create_lightning_cage("Frame", radius=0.6, segments=8)
-    elif house_name == "FROST":
-        core = create_ice_crystal("Core", size=0.6)
-        frame = create_snowflake_frame("Frame", radius=0.65)
-    elif house_name == "AURORA":
-        core = create_faceted_sphere("Core", radius=0.35, subdivisions=3)
-        frame = create_flowing_ribbons("Frame", radius=0.55, ribbon_count=6)
-    elif house_name == "SAND":
-        core = create_pyramid_core("Core", size=0.55)
-        frame = create_hieroglyph_ring("Frame", radius=0.6)
-    elif house_name == "ECLIPSE":
-        core = create_black_hole_core("Core", radius=0.3)
-        frame = create_corona_ring("Frame", radius=0.6)
-    else:
-        core = create_faceted_sphere("Core", radius=0.35)
-        frame = create_sunburst_frame("Frame", radius=0.6)
+    core, frame = _GEOMETRY_BUILDERS.get(house_name, _default_geometry)()
 
     # Apply materials
     core.data.materials.append(core_mat)
     frame.data.materials.append(frame_mat)
 
-    # Link to collections
+    # Data-API objects start unlinked, so one link places each in its collection
     collections['Core'].objects.link(core)
-    safe_unlink_from_scene(core)
-
     collections['Frame'].objects.link(frame)
-    safe_unlink_from_scene(frame)
 
     # Base platform
     base_style = "crystal" if house_name in ["CLEAR", "FROST"] else "ancient" if house_name == "SAND" else "default"
     base = create_base_platform("Base", style=base_style)
     base.data.materials.append(base_mat)
     collections['Core'].objects.link(base)
-    safe_unlink_from_scene(base)
 
     # Decorative particles
-    particle_color = house_config.get("emission_color", house_config.get("accent_color", (1.0, 1.0, 1.0)))
-    particle_strength = house_config.get("emission_strength", 3.0)
-    if isinstance(particle_strength, tuple):
-        particle_strength = particle_strength[0]
+    particle_color = house_config.emission_color
+    particle_strength = house_config.emission_strength
 
     particle_mat = create_emission_material(
         f"MAT_Particles_{house_name}",
@@ -1872,14 +2631,11 @@ def generate_house_template(house_name, house_config, output_dir):
     particles = create_floating_particles("Particles", count=25, radius_range=(0.5, 0.9), size=0.012)
     particles.data.materials.append(particle_mat)
     collections['Decorations'].objects.link(particles)
-    safe_unlink_from_scene(particles)
 
     # Energy rings for certain houses
     if house_name in ["THUNDER", "AURORA", "ECLIPSE"]:
         ring_color = house_config.get("orbit_emission_color", particle_color)
         ring_strength = house_config.get("orbit_emission_strength", particle_strength)
-        if isinstance(ring_strength, tuple):
-            ring_strength = ring_strength[0]
 
         ring_mat = create_emission_material(
             f"MAT_Rings_{house_name}",
@@ -1889,29 +2645,52 @@ def generate_house_template(house_name, house_config, output_dir):
         rings = create_energy_rings("EnergyRings", count=3, base_radius=0.4)
         rings.data.materials.append(ring_mat)
         collections['Effects'].objects.link(rings)
-        safe_unlink_from_scene(rings)
 
-    # Setup scene
-    setup_studio_lighting(house_config, collections)
-    create_camera(collections)
-    setup_world(house_config)
+    # House-specific lights and atmosphere
+    setup_light_signature(house_name, house_config, collections)
     setup_atmosphere(house_config, collections)
-    setup_render_settings()
-    setup_compositor(house_config)
-
-    # Save
-    output_path = os.path.join(output_dir, f"house_{house_name.lower()}.blend")
-    bpy.ops.wm.save_as_mainfile(filepath=output_path)
-    print(f"  Saved: {output_path}")
-
-    return output_path
 
 
 # ============================================================
 #                         MAIN
 # ============================================================
 
+def generate_house_subprocess(house_name, output_dir, shader_cache_dir):
+    """Generate one house template in a separate headless Blender process."""
+    blender = bpy.app.binary_path or "blender"
+    # Factory settings skip the user's startup file and add-ons, which every worker would reload
+    cmd = [
+        blender, "-b", "--factory-startup", "-P", os.path.abspath(__file__),
+        "--", "--house", house_name, "--output-dir", output_dir,
+        "--shader-cache", shader_cache_dir,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+    return house_name, result.returncode
+
+
+def generate_houses_parallel(house_names, output_dir, shader_cache_dir, workers):
+    """Fan house generation out to Blender worker processes; return the failed houses."""
+    # Threads only wait on the child processes, each of which owns its own bpy state
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            lambda house_name: generate_house_subprocess(house_name, output_dir, shader_cache_dir),
+            house_names,
+        )
+        failed = []
+        for house_name, returncode in results:
+            status = "done" if returncode == 0 else f"FAILED (exit {returncode})"
+            print(f"  House {house_name}: {status}")
+            if returncode != 0:
+                failed.append(house_name)
+    return failed
+
+
 def main():
+    import argparse
+
     argv = sys.argv
     if "--" in argv:
         argv = argv[argv.index("--") + 1:]
@@ -1921,21 +2700,32 @@ def main():
     parser = argparse.ArgumentParser(description="Generate HouseForge Blender templates v3.0")
     parser.add_argument("--output-dir", default="./scenes", help="Output directory for .blend files")
     parser.add_argument("--house", default=None, help="Generate only specific house (e.g., CLEAR)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Generate houses in N parallel Blender processes (default: 1, in-process)")
+    parser.add_argument("--shader-cache", default=None,
+                        help="Directory for the template shader cache (default: Blender user datafiles)")
     args = parser.parse_args(argv)
 
     os.makedirs(args.output_dir, exist_ok=True)
-
-    print("=" * 60)
-    print("HouseForge Template Generator v3.0 - Professional Edition")
-    print("=" * 60)
-    print("Features:")
-    print("  - Deep blue-black studio background")
-    print("  - Emission plane softbox lighting (Key/Fill/Rim/Accent)")
-    print("  - House-specific light signatures")
-    print("  - Volumetric atmosphere")
-    print("  - Filmic color management")
-    print("  - Professional compositor pipeline")
-    print("=" * 60)
+    shader_cache_dir = os.path.abspath(args.shader_cache or _default_shader_cache_dir())
+    shader_cache_hit = load_shader_cache(shader_cache_dir)
+
+    # Batch generation never undoes, so skip the undo pushes
+    bpy.context.preferences.edit.use_global_undo = False
+
+    # Single-house runs are usually --workers children; only the parent prints the banner
+    if not args.house:
+        print("=" * 60)
+        print("HouseForge Template Generator v3.0 - Professional Edition")
+        print("=" * 60)
+        print("Features:")
+        print("  - Deep blue-black studio background")
+        print("  - Emission plane softbox lighting (Key/Fill/Rim/Accent)")
+        print("  - House-specific light signatures")
+        print("  - Volumetric atmosphere")
+        print("  - Filmic color management")
+        print("  - Professional compositor pipeline")
+        print("=" * 60)
 
     if args.house:
         if args.house.upper() in HOUSES:
@@ -1943,13 +2733,23 @@ def main():
         else:
             print(f"Unknown house: {args.house}")
             sys.exit(1)
+    elif args.workers > 1:
+        workers = min(args.workers, len(HOUSES), os.cpu_count() or 1)
+        print(f"Generating {len(HOUSES)} houses with {workers} workers...")
+        failed = generate_houses_parallel(list(HOUSES), os.path.abspath(args.output_dir), shader_cache_dir, workers)
+        if failed:
+            print(f"Failed houses: {', '.join(failed)}")
+            sys.exit(1)
     else:
-        for house_name, house_config in HOUSES.items():
-            generate_house_template(house_name, house_config, args.output_dir)
+        generate_house_templates(list(HOUSES), args.output_dir)
+
+    if not shader_cache_hit:
+        save_shader_cache(shader_cache_dir)
 
-    print("\n" + "=" * 60)
-    print("Template generation complete!")
-    print("=" * 60)
+    if not args.house:
+        print("\n" + "=" * 60)
+        print("Template generation complete!")
+        print("=" * 60)
 
 
 if __name__ == "__main__":
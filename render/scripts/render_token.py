@@ -5,92 +5,291 @@ Renders a single token from a render recipe JSON.
 
 Usage:
     blender -b <template.blend> -P render_token.py -- <recipe.json> <output_path>
+    blender -b <template.blend> -P render_token.py -- <batch.jsonl|batch.manifest.json> [--fresh-scene] [--quiet]
 
 The recipe JSON should contain all trait information needed to configure
 materials, lights, geometry, and render settings.
+
+A batch manifest lists {"recipe", "output"[, "template"]} entries (a JSON
+array, or one object per line for .jsonl) rendered in one Blender session.
+Entries with a different template reopen it, and entries without one use the
+.blend given on the command line; --fresh-scene also reverts the
+template between tokens instead of reusing the configured scene. --quiet
+drops per-token progress output; warnings and errors are still printed.
 """
 
 import bpy
 import json
-import math
 import os
 import sys
 import random
-import hashlib
+
+# orjson parses recipes several times faster; Blender's bundled Python may not ship it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled schema validation is optional; without it only required keys are checked
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+# ============================================================
+#                    TRAIT LOOKUP TABLES
+# ============================================================
+
+# Frame finish -> Principled color/metallic/roughness (colors pre-packed as RGBA)
+_FRAME_MATERIALS = {
+    "BrushedSteel": {"color": (0.6, 0.6, 0.62, 1.0), "metallic": 1.0, "roughness": 0.35},
+    "PolishedBrass": {"color": (0.85, 0.65, 0.3, 1.0), "metallic": 1.0, "roughness": 0.15},
+    "AntiqueBronze": {"color": (0.45, 0.35, 0.25, 1.0), "metallic": 1.0, "roughness": 0.5},
+    "WhiteGold": {"color": (0.9, 0.88, 0.8, 1.0), "metallic": 1.0, "roughness": 0.1},
+    "BlackTitanium": {"color": (0.08, 0.08, 0.1, 1.0), "metallic": 1.0, "roughness": 0.25},
+    "CopperVerde": {"color": (0.7, 0.45, 0.35, 1.0), "metallic": 1.0, "roughness": 0.4},
+    "RoseGold": {"color": (0.9, 0.6, 0.55, 1.0), "metallic": 1.0, "roughness": 0.2},
+    "PlatinumMatte": {"color": (0.75, 0.75, 0.78, 1.0), "metallic": 1.0, "roughness": 0.6},
+    "MirrorChrome": {"color": (0.95, 0.95, 0.97, 1.0), "metallic": 1.0, "roughness": 0.02},
+    "GunmetalBlue": {"color": (0.25, 0.28, 0.35, 1.0), "metallic": 1.0, "roughness": 0.3},
+}
+
+
+# Core material -> Principled color/transmission/roughness, optional metallic and emission
+# (colors pre-packed as RGBA)
+_CORE_MATERIALS = {
+    "ClearCrystal": {"color": (0.98, 0.99, 1.0, 1.0), "transmission": 0.95, "roughness": 0.02},
+    "CloudGlass": {"color": (0.95, 0.96, 0.98, 1.0), "transmission": 0.7, "roughness": 0.15},
+    "LiquidMercury": {"color": (0.85, 0.85, 0.88, 1.0), "transmission": 0.0, "roughness": 0.05, "metallic": 0.95},
+    "MoltenAmber": {"color": (1.0, 0.7, 0.3, 1.0), "transmission": 0.85, "roughness": 0.1, "emission": 0.1},
+    "VoidObsidian": {"color": (0.02, 0.02, 0.03, 1.0), "transmission": 0.4, "roughness": 0.08},
+    "FrozenPlasma": {"color": (0.6, 0.8, 1.0, 1.0), "transmission": 0.3, "roughness": 0.1, "emission": 2.0},
+    "StormEssence": {"color": (0.5, 0.6, 0.8, 1.0), "transmission": 0.5, "roughness": 0.2, "emission": 0.5},
+    "DesertQuartz": {"color": (1.0, 0.95, 0.85, 1.0), "transmission": 0.8, "roughness": 0.2},
+    "AuroraSilk": {"color": (0.8, 0.85, 0.9, 1.0), "transmission": 0.6, "roughness": 0.3},
+    "EclipseCore": {"color": (0.1, 0.08, 0.12, 1.0), "transmission": 0.2, "roughness": 0.05, "emission": 0.3},
+}
+
+
+# Surface aging -> roughness added on top of the finish
+_AGING_PARAMS = {
+    "Pristine": {"roughness_add": 0.0},
+    "SlightWear": {"roughness_add": 0.05},
+    "LightPatina": {"roughness_add": 0.1},
+    "WeatheredGrace": {"roughness_add": 0.15},
+    "AncientRelic": {"roughness_add": 0.25},
+}
+
+
+# Light signature -> key light energy multiplier and accent color
+_SIGNATURES = {
+    "Sunbeam": {"energy_mult": 1.2, "accent_color": (1.0, 0.95, 0.85)},
+    "PrismaticRay": {"energy_mult": 1.0, "accent_color": (1.0, 0.9, 0.95)},
+    "NeonRain": {"energy_mult": 0.8, "accent_color": (0.4, 0.9, 1.0)},
+    "WetGlow": {"energy_mult": 0.7, "accent_color": (0.85, 0.92, 1.0)},
+    "LightningFork": {"energy_mult": 1.5, "accent_color": (0.7, 0.85, 1.0)},
+    "IonBloom": {"energy_mult": 0.9, "accent_color": (0.6, 0.5, 1.0)},
+    "PolarGlow": {"energy_mult": 0.85, "accent_color": (0.6, 0.9, 0.8)},
+    "FrostScatter": {"energy_mult": 1.1, "accent_color": (0.8, 0.95, 1.0)},
+    "AuroraRibbon": {"energy_mult": 0.75, "accent_color": (0.3, 1.0, 0.6)},
+    "SpectrumVeil": {"energy_mult": 0.7, "accent_color": (0.8, 0.7, 1.0)},
+    "GoldenHaze": {"energy_mult": 1.3, "accent_color": (1.0, 0.85, 0.6)},
+    "DustHalo": {"energy_mult": 0.9, "accent_color": (1.0, 0.9, 0.75)},
+    "EclipseHalo": {"energy_mult": 0.4, "accent_color": (1.0, 0.7, 0.4)},
+    "RingRim": {"energy_mult": 0.3, "accent_color": (1.0, 0.8, 0.5)},
+}
+
+
+# Light signature used when a recipe has none, per house
+_HOUSE_DEFAULTS = {
+    "CLEAR": "Sunbeam",
+    "MONSOON": "NeonRain",
+    "THUNDER": "LightningFork",
+    "FROST": "PolarGlow",
+    "AURORA": "AuroraRibbon",
+    "SAND": "GoldenHaze",
+    "ECLIPSE": "EclipseHalo",
+}
+
+
+# Lens bloom -> compositor glare settings
+_BLOOM_SETTINGS = {
+    "None": {"enabled": False},
+    "Subtle": {"threshold": 0.9, "size": 3, "mix": 0},
+    "Moderate": {"threshold": 0.8, "size": 5, "mix": 0},
+    "Intense": {"threshold": 0.7, "size": 8, "mix": 0},
+    "Cinematic": {"threshold": 0.75, "size": 6, "mix": 0},
+}
+
+
+# Geometry variants toggled by DioramaGeometry
+_GEOMETRY_OBJECTS = ("Geo_Capsule", "Geo_Obelisk", "Geo_Cube", "Geo_Sphere", "Geo_Prism", "Geo_BarometerAssembly")
+
+
+# Palette temperature -> view exposure
+_TEMP_SETTINGS = {
+    "Warm": {"exposure": 0.1},
+    "Cool": {"exposure": 0.0},
+    "Neutral": {"exposure": 0.0},
+    "HighContrast": {"exposure": 0.05},
+    "Desaturated": {"exposure": 0.0},
+}
+
+
+_REQUIRED_FIELDS = frozenset(('tokenId', 'houseKey', 'seed', 'traits', 'output', 'renderSettings'))
+
+# Shape of the fields the renderer reads. Trait values stay free-form: unknown
+# ones fall back to table defaults rather than failing the render.
+_RECIPE_SCHEMA = {
+    "type": "object",
+    "required": sorted(_REQUIRED_FIELDS),
+    "properties": {
+        "tokenId": {"type": "integer", "minimum": 0},
+        "houseKey": {"enum": sorted(_HOUSE_DEFAULTS)},
+        "seed": {"type": "string", "pattern": "^(0[xX])?[0-9a-fA-F]+$"},
+        "traits": {"type": "object", "additionalProperties": {"type": "string"}},
+        "output": {
+            "type": "object",
+            "properties": {
+                "width": {"type": "integer", "minimum": 1},
+                "height": {"type": "integer", "minimum": 1},
+                "format": {"type": "string"},
+                "quality": {"type": "integer", "minimum": 0, "maximum": 100},
+                "transparentBackground": {"type": "boolean"},
+            },
+        },
+        "renderSettings": {
+            "type": "object",
+            "properties": {
+                "engine": {"type": "string"},
+                "samples": {"type": "integer", "minimum": 1},
+                "denoise": {"type": "boolean"},
+                "adaptiveSampling": {"type": "boolean"},
+                "maxBounces": {"type": "integer", "minimum": 0},
+            },
+        },
+    },
+}
+
+_validate_recipe = fastjsonschema.compile(_RECIPE_SCHEMA) if fastjsonschema is not None else None
 
 
 def load_recipe(recipe_path):
     """Load and validate the render recipe."""
-    with open(recipe_path, 'r') as f:
-        recipe = json.load(f)
+    with open(recipe_path, 'rb') as f:
+        data = f.read()
+    recipe = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    missing = _REQUIRED_FIELDS - recipe.keys()
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
 
-    required_fields = ['tokenId', 'houseKey', 'seed', 'traits', 'output', 'renderSettings']
-    for field in required_fields:
-        if field not in recipe:
-            raise ValueError(f"Missing required field: {field}")
+    if _validate_recipe is not None:
+        try:
+            _validate_recipe(recipe)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValueError(f"Invalid recipe: {e.message}") from e
 
     return recipe
 
 
 def seed_random(seed_hex):
     """Initialize random from hex seed for deterministic results."""
-    # Convert hex seed to integer
-    seed_int = int(seed_hex, 16) if seed_hex.startswith('0x') else int(seed_hex, 16)
-    random.seed(seed_int % (2**32))
+    # The low 32 bits are the last 8 hex digits, so skip parsing the full seed
+    if seed_hex.startswith(('0x', '0X')):
+        seed_hex = seed_hex[2:]
+    seed_int = int(seed_hex[-8:], 16)
+    random.seed(seed_int)
     return seed_int
 
 
 def get_material_params(frame_type):
     """Get material parameters for frame type."""
-    frame_materials = {
-        "BrushedSteel": {"color": (0.6, 0.6, 0.62), "metallic": 1.0, "roughness": 0.35},
-        "PolishedBrass": {"color": (0.85, 0.65, 0.3), "metallic": 1.0, "roughness": 0.15},
-        "AntiqueBronze": {"color": (0.45, 0.35, 0.25), "metallic": 1.0, "roughness": 0.5},
-        "WhiteGold": {"color": (0.9, 0.88, 0.8), "metallic": 1.0, "roughness": 0.1},
-        "BlackTitanium": {"color": (0.08, 0.08, 0.1), "metallic": 1.0, "roughness": 0.25},
-        "CopperVerde": {"color": (0.7, 0.45, 0.35), "metallic": 1.0, "roughness": 0.4},
-        "RoseGold": {"color": (0.9, 0.6, 0.55), "metallic": 1.0, "roughness": 0.2},
-        "PlatinumMatte": {"color": (0.75, 0.75, 0.78), "metallic": 1.0, "roughness": 0.6},
-        "MirrorChrome": {"color": (0.95, 0.95, 0.97), "metallic": 1.0, "roughness": 0.02},
-        "GunmetalBlue": {"color": (0.25, 0.28, 0.35), "metallic": 1.0, "roughness": 0.3},
-    }
-    return frame_materials.get(frame_type, frame_materials["BrushedSteel"])
+    return _FRAME_MATERIALS.get(frame_type, _FRAME_MATERIALS["BrushedSteel"])
 
 
 def get_core_material_params(core_material):
     """Get material parameters for core type."""
-    core_materials = {
-        "ClearCrystal": {"color": (0.98, 0.99, 1.0), "transmission": 0.95, "roughness": 0.02},
-        "CloudGlass": {"color": (0.95, 0.96, 0.98), "transmission": 0.7, "roughness": 0.15},
-        "LiquidMercury": {"color": (0.85, 0.85, 0.88), "transmission": 0.0, "roughness": 0.05, "metallic": 0.95},
-        "MoltenAmber": {"color": (1.0, 0.7, 0.3), "transmission": 0.85, "roughness": 0.1, "emission": 0.1},
-        "VoidObsidian": {"color": (0.02, 0.02, 0.03), "transmission": 0.4, "roughness": 0.08},
-        "FrozenPlasma": {"color": (0.6, 0.8, 1.0), "transmission": 0.3, "roughness": 0.1, "emission": 2.0},
-        "StormEssence": {"color": (0.5, 0.6, 0.8), "transmission": 0.5, "roughness": 0.2, "emission": 0.5},
-        "DesertQuartz": {"color": (1.0, 0.95, 0.85), "transmission": 0.8, "roughness": 0.2},
-        "AuroraSilk": {"color": (0.8, 0.85, 0.9), "transmission": 0.6, "roughness": 0.3},
-        "EclipseCore": {"color": (0.1, 0.08, 0.12), "transmission": 0.2, "roughness": 0.05, "emission": 0.3},
-    }
-    return core_materials.get(core_material, core_materials["ClearCrystal"])
-
-
-def apply_surface_aging(material, aging_type):
-    """Apply surface aging effects to material."""
-    aging_params = {
-        "Pristine": {"roughness_add": 0.0},
-        "SlightWear": {"roughness_add": 0.05},
-        "LightPatina": {"roughness_add": 0.1},
-        "WeatheredGrace": {"roughness_add": 0.15},
-        "AncientRelic": {"roughness_add": 0.25},
-    }
-
-    params = aging_params.get(aging_type, aging_params["Pristine"])
-
-    if material.use_nodes:
-        for node in material.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                current_roughness = node.inputs['Roughness'].default_value
-                node.inputs['Roughness'].default_value = min(1.0, current_roughness + params["roughness_add"])
+    return _CORE_MATERIALS.get(core_material, _CORE_MATERIALS["ClearCrystal"])
+
+
+# Material name -> material, and -> its Principled BSDF node, so each is resolved once
+_MATERIAL_CACHE = {}
+_PRINCIPLED_CACHE = {}
+
+# Object name -> (material, node) pairs for its emission nodes across all slots
+_EMISSION_NODES = {}
+
+# Scene name -> its compositor Glare node (templates build exactly one)
+_GLARE_CACHE = {}
+
+# Template values of settings a recipe scales or may leave alone, recorded before
+# the first write so batched renders on one loaded .blend never compound
+_TEMPLATE_VALUES = {}
+
+
+@bpy.app.handlers.persistent
+def _clear_node_caches(*_args):
+    """Drop cached node references when a new .blend replaces the data they point into."""
+    _MATERIAL_CACHE.clear()
+    _PRINCIPLED_CACHE.clear()
+    _EMISSION_NODES.clear()
+    _GLARE_CACHE.clear()
+    _TEMPLATE_VALUES.clear()
+
+
+bpy.app.handlers.load_post.append(_clear_node_caches)
+
+
+def _template_value(key, current):
+    """Return the value a setting had in the loaded template, recording it on first sight."""
+    return _TEMPLATE_VALUES.setdefault(key, current)
+
+
+def _get_or_create_material(name):
+    """Return the named node material, creating it on first use."""
+    try:
+        return _MATERIAL_CACHE[name]
+    except KeyError:
+        mat = bpy.data.materials.get(name)
+        if not mat:
+            mat = bpy.data.materials.new(name=name)
+            mat.use_nodes = True
+        _MATERIAL_CACHE[name] = mat
+        return mat
+
+
+def _get_principled(mat):
+    """Return the material's Principled BSDF node, scanning its tree only once."""
+    try:
+        return _PRINCIPLED_CACHE[mat.name]
+    except KeyError:
+        nodes = mat.node_tree.nodes
+        # New materials get the default node by name; only scan when it was renamed
+        node = nodes.get('Principled BSDF')
+        if node is None or node.type != 'BSDF_PRINCIPLED':
+            node = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        _PRINCIPLED_CACHE[mat.name] = node
+        return node
+
+
+def _get_emission_nodes(obj):
+    """Return (material, node) pairs for an object's Emission nodes and EmissionTemplate groups."""
+    try:
+        return _EMISSION_NODES[obj.name]
+    except KeyError:
+        # Slots resolve object-linked materials on shared light meshes; template
+        # lights wrap their Emission node in the EmissionTemplate group
+        nodes = tuple(
+            (slot.material, node)
+            for slot in obj.material_slots
+            if slot.material and slot.material.use_nodes
+            for node in slot.material.node_tree.nodes
+            if node.type in ('EMISSION', 'GROUP')
+        )
+        _EMISSION_NODES[obj.name] = nodes
+        return nodes
 
 
 def configure_frame_material(traits):
@@ -103,23 +302,19 @@ def configure_frame_material(traits):
     params = get_material_params(frame_type)
 
     # Get or create material
-    mat_name = f"MAT_Frame_{frame_type}"
-    mat = bpy.data.materials.get(mat_name)
-    if not mat:
-        mat = bpy.data.materials.new(name=mat_name)
-        mat.use_nodes = True
+    mat = _get_or_create_material(f"MAT_Frame_{frame_type}")
 
-    # Configure material
-    nodes = mat.node_tree.nodes
-    for node in nodes:
-        if node.type == 'BSDF_PRINCIPLED':
-            node.inputs['Base Color'].default_value = (*params["color"], 1.0)
-            node.inputs['Metallic'].default_value = params["metallic"]
-            node.inputs['Roughness'].default_value = params["roughness"]
-
-    # Apply surface aging
+    # Surface aging roughens the finish; fold it in so the node is written once
     aging = traits.get("SurfaceAging", "Pristine")
-    apply_surface_aging(mat, aging)
+    aging_add = _AGING_PARAMS.get(aging, _AGING_PARAMS["Pristine"])["roughness_add"]
+    roughness = min(1.0, params["roughness"] + aging_add)
+
+    # Configure material
+    node = _get_principled(mat)
+    if node:
+        node.inputs['Base Color'].default_value = params["color"]
+        node.inputs['Metallic'].default_value = params["metallic"]
+        node.inputs['Roughness'].default_value = roughness
 
     # Assign material
     if len(frame.data.materials) > 0:
@@ -137,24 +332,19 @@ def configure_core_material(traits):
     core_type = traits.get("CoreMaterial", "ClearCrystal")
     params = get_core_material_params(core_type)
 
-    mat_name = f"MAT_Core_{core_type}"
-    mat = bpy.data.materials.get(mat_name)
-    if not mat:
-        mat = bpy.data.materials.new(name=mat_name)
-        mat.use_nodes = True
-
-    nodes = mat.node_tree.nodes
-    for node in nodes:
-        if node.type == 'BSDF_PRINCIPLED':
-            node.inputs['Base Color'].default_value = (*params["color"], 1.0)
-            node.inputs['Roughness'].default_value = params["roughness"]
-            node.inputs['Transmission Weight'].default_value = params.get("transmission", 0.0)
-            node.inputs['Metallic'].default_value = params.get("metallic", 0.0)
-
-            # Emission
-            if params.get("emission", 0) > 0:
-                node.inputs['Emission Strength'].default_value = params["emission"]
-                node.inputs['Emission Color'].default_value = (*params["color"], 1.0)
+    mat = _get_or_create_material(f"MAT_Core_{core_type}")
+
+    node = _get_principled(mat)
+    if node:
+        node.inputs['Base Color'].default_value = params["color"]
+        node.inputs['Roughness'].default_value = params["roughness"]
+        node.inputs['Transmission Weight'].default_value = params.get("transmission", 0.0)
+        node.inputs['Metallic'].default_value = params.get("metallic", 0.0)
+
+        # Emission
+        if params.get("emission", 0) > 0:
+            node.inputs['Emission Strength'].default_value = params["emission"]
+            node.inputs['Emission Color'].default_value = params["color"]
 
     if len(core.data.materials) > 0:
         core.data.materials[0] = mat
@@ -166,139 +356,104 @@ def configure_geometry(traits):
     """Switch visible geometry based on DioramaGeometry trait."""
     geometry_type = traits.get("DioramaGeometry", "Sphere")
 
-    # Hide all geometry variants
-    geometry_objects = ["Geo_Capsule", "Geo_Obelisk", "Geo_Cube", "Geo_Sphere", "Geo_Prism", "Geo_BarometerAssembly"]
-    for obj_name in geometry_objects:
-        obj = bpy.data.objects.get(obj_name)
+    target_name = f"Geo_{geometry_type}"
+
+    # Show the selected variant and hide the rest, resolving each object once
+    objects = bpy.data.objects
+    for obj_name in _GEOMETRY_OBJECTS:
+        obj = objects.get(obj_name)
         if obj:
-            obj.hide_viewport = True
-            obj.hide_render = True
+            hidden = obj_name != target_name
+            obj.hide_viewport = hidden
+            obj.hide_render = hidden
 
-    # Show selected geometry
-    target_name = f"Geo_{geometry_type}"
-    target = bpy.data.objects.get(target_name)
-    if target:
-        target.hide_viewport = False
-        target.hide_render = False
+    if target_name not in _GEOMETRY_OBJECTS:
+        target = objects.get(target_name)
+        if target:
+            target.hide_viewport = False
+            target.hide_render = False
 
 
 def get_light_signature_params(signature):
     """Get light configuration for a signature."""
-    signatures = {
-        "Sunbeam": {"energy_mult": 1.2, "accent_color": (1.0, 0.95, 0.85)},
-        "PrismaticRay": {"energy_mult": 1.0, "accent_color": (1.0, 0.9, 0.95)},
-        "NeonRain": {"energy_mult": 0.8, "accent_color": (0.4, 0.9, 1.0)},
-        "WetGlow": {"energy_mult": 0.7, "accent_color": (0.85, 0.92, 1.0)},
-        "LightningFork": {"energy_mult": 1.5, "accent_color": (0.7, 0.85, 1.0)},
-        "IonBloom": {"energy_mult": 0.9, "accent_color": (0.6, 0.5, 1.0)},
-        "PolarGlow": {"energy_mult": 0.85, "accent_color": (0.6, 0.9, 0.8)},
-        "FrostScatter": {"energy_mult": 1.1, "accent_color": (0.8, 0.95, 1.0)},
-        "AuroraRibbon": {"energy_mult": 0.75, "accent_color": (0.3, 1.0, 0.6)},
-        "SpectrumVeil": {"energy_mult": 0.7, "accent_color": (0.8, 0.7, 1.0)},
-        "GoldenHaze": {"energy_mult": 1.3, "accent_color": (1.0, 0.85, 0.6)},
-        "DustHalo": {"energy_mult": 0.9, "accent_color": (1.0, 0.9, 0.75)},
-        "EclipseHalo": {"energy_mult": 0.4, "accent_color": (1.0, 0.7, 0.4)},
-        "RingRim": {"energy_mult": 0.3, "accent_color": (1.0, 0.8, 0.5)},
-    }
-    return signatures.get(signature, signatures["Sunbeam"])
+    return _SIGNATURES.get(signature, _SIGNATURES["Sunbeam"])
 
 
 def adjust_emission_plane_strength(obj, multiplier):
     """Adjust emission strength for an emission plane object."""
-    if not obj or not obj.data or not obj.data.materials:
+    if not obj or not obj.material_slots:
         return
 
-    for mat in obj.data.materials:
-        if not mat or not mat.use_nodes:
-            continue
-        for node in mat.node_tree.nodes:
-            if node.type == 'EMISSION':
-                current = node.inputs['Strength'].default_value
-                node.inputs['Strength'].default_value = current * multiplier
+    for mat, node in _get_emission_nodes(obj):
+        if 'Strength' in node.inputs:
+            strength = node.inputs['Strength']
+            base = _template_value((mat.name, node.name, 'Strength'), strength.default_value)
+            strength.default_value = base * multiplier
 
 
 def adjust_emission_plane_color(obj, color):
     """Adjust emission color for an emission plane object."""
-    if not obj or not obj.data or not obj.data.materials:
+    if not obj or not obj.material_slots:
         return
 
-    for mat in obj.data.materials:
-        if not mat or not mat.use_nodes:
-            continue
-        for node in mat.node_tree.nodes:
-            if node.type == 'EMISSION':
-                node.inputs['Color'].default_value = (*color, 1.0)
+    for _mat, node in _get_emission_nodes(obj):
+        if 'Color' in node.inputs:
+            node.inputs['Color'].default_value = (*color, 1.0)
 
 
 def configure_lights(traits, house_key):
     """Configure lighting based on traits."""
     light_signature = traits.get("LightSignature")
 
-    # Default signatures per house
-    house_defaults = {
-        "CLEAR": "Sunbeam",
-        "MONSOON": "NeonRain",
-        "THUNDER": "LightningFork",
-        "FROST": "PolarGlow",
-        "AURORA": "AuroraRibbon",
-        "SAND": "GoldenHaze",
-        "ECLIPSE": "EclipseHalo",
-    }
-
     if not light_signature:
-        light_signature = house_defaults.get(house_key, "Sunbeam")
+        light_signature = _HOUSE_DEFAULTS.get(house_key, "Sunbeam")
 
     params = get_light_signature_params(light_signature)
 
+    objects = bpy.data.objects
+    key_light = objects.get("Light_Key")
+    accent_light = objects.get("Light_Accent")
+    fill_light = objects.get("Light_Fill")
+
     # Adjust key light - could be emission plane or traditional light
-    key_light = bpy.data.objects.get("Light_Key")
     if key_light:
-        if key_light.type == 'LIGHT':
-            key_light.data.energy *= params["energy_mult"]
-        elif key_light.type == 'MESH':
+        key_type = key_light.type
+        if key_type == 'LIGHT':
+            base = _template_value((key_light.name, 'energy'), key_light.data.energy)
+            key_light.data.energy = base * params["energy_mult"]
+        elif key_type == 'MESH':
             adjust_emission_plane_strength(key_light, params["energy_mult"])
 
-    # Adjust accent/fill lights with color
-    for light_name in ["Light_Accent", "Light_Fill"]:
-        light = bpy.data.objects.get(light_name)
-        if light:
-            if light.type == 'LIGHT':
-                light.data.color = params["accent_color"]
-            elif light.type == 'MESH':
-                # Only tint slightly, don't fully change color
-                pass  # Keep template colors for emission planes
+    # Tint accent/fill lights; emission planes keep their template colors
+    accent_color = params["accent_color"]
+    if accent_light and accent_light.type == 'LIGHT':
+        accent_light.data.color = accent_color
+    if fill_light and fill_light.type == 'LIGHT':
+        fill_light.data.color = accent_color
 
 
-def configure_atmosphere(traits):
-    """Configure atmospheric effects based on traits."""
-    atmosphere = traits.get("Atmosphere", "Clear")
+# Cycles enum values written on every render
+_DEVICE_GPU = 'GPU'
+_COMPUTE_DEVICE_TYPE = 'OPTIX'
+_GPU_DEVICE_TYPES = frozenset(('OPTIX', 'CUDA', 'OPENCL'))
+_DENOISER = 'OPENIMAGEDENOISE'
+_ADAPTIVE_THRESHOLD = 0.015
 
-    # Volumetric settings for Cycles
-    world = bpy.context.scene.world
-    if not world:
-        return
+# Per-type bounce caps (diffuse, glossy, transmission, volume) under maxBounces
+_BOUNCE_CAPS = (2, 3, 6, 2)
 
-    # Note: Full volumetric implementation would require volume scatter nodes
-    # This is a simplified version that adjusts world settings
 
-    atmosphere_settings = {
-        "Clear": {"volume_density": 0.0},
-        "MistVeil": {"volume_density": 0.1},
-        "RainCurtain": {"volume_density": 0.08},
-        "DustStorm": {"volume_density": 0.15},
-        "SnowDrift": {"volume_density": 0.05},
-        "ThunderCloud": {"volume_density": 0.12},
-        "AuroraWisp": {"volume_density": 0.03},
-        "EclipseShadow": {"volume_density": 0.08},
-    }
+def _clamp_bounces(max_bounces):
+    """Return the diffuse/glossy/transmission/volume bounces for a total bounce budget."""
+    return tuple(cap if cap < max_bounces else max_bounces for cap in _BOUNCE_CAPS)
 
-    settings = atmosphere_settings.get(atmosphere, atmosphere_settings["Clear"])
-    # Volume implementation would go here for full effect
 
+# Cycles device preferences outlive the loaded .blend, so they are set up once
+_GPU_CONFIGURED = False
 
-def configure_render_settings(render_settings):
+
+def configure_render_settings(scene, render_settings):
     """Apply render settings from recipe."""
-    scene = bpy.context.scene
 
     # Engine
     engine = render_settings.get("engine", "CYCLES")
@@ -307,142 +462,199 @@ def configure_render_settings(render_settings):
     if engine == "CYCLES":
         cycles = scene.cycles
 
-        # Enable GPU rendering with OptiX
-        cycles.device = 'GPU'
-        try:
-            prefs = bpy.context.preferences.addons['cycles'].preferences
-            prefs.compute_device_type = 'OPTIX'
-            prefs.get_devices()
-            for device in prefs.devices:
-                device.use = device.type in ('OPTIX', 'CUDA', 'OPENCL')
-        except Exception as e:
-            print(f"Warning: Could not configure GPU: {e}")
+        # Enable GPU rendering with OptiX; device enumeration initializes the
+        # drivers, so only do it once per process and only if prefs have none
+        cycles.device = _DEVICE_GPU
+        global _GPU_CONFIGURED
+        if not _GPU_CONFIGURED:
+            try:
+                prefs = bpy.context.preferences.addons['cycles'].preferences
+                prefs.compute_device_type = _COMPUTE_DEVICE_TYPE
+                devices = prefs.devices
+                if not devices:
+                    prefs.get_devices()
+                for device in devices:
+                    device.use = device.type in _GPU_DEVICE_TYPES
+                _GPU_CONFIGURED = True
+            except Exception as e:
+                print(f"Warning: Could not configure GPU: {e}")
 
         # Samples
         cycles.samples = render_settings.get("samples", 96)
 
-        # Denoising
+        # Denoising; a recipe without it keeps the template's setup
+        template_denoise = _template_value('denoise', (cycles.use_denoising, cycles.denoiser))
         if render_settings.get("denoise", True):
             cycles.use_denoising = True
-            cycles.denoiser = 'OPENIMAGEDENOISE'
+            cycles.denoiser = _DENOISER
+        else:
+            cycles.use_denoising, cycles.denoiser = template_denoise
 
         # Adaptive sampling
+        template_adaptive = _template_value('adaptive', (cycles.use_adaptive_sampling, cycles.adaptive_threshold))
         if render_settings.get("adaptiveSampling", True):
             cycles.use_adaptive_sampling = True
-            cycles.adaptive_threshold = 0.015
+            cycles.adaptive_threshold = _ADAPTIVE_THRESHOLD
+        else:
+            cycles.use_adaptive_sampling, cycles.adaptive_threshold = template_adaptive
 
         # Bounces
         max_bounces = render_settings.get("maxBounces", 6)
+        diffuse, glossy, transmission, volume = _clamp_bounces(max_bounces)
         cycles.max_bounces = max_bounces
-        cycles.diffuse_bounces = min(2, max_bounces)
-        cycles.glossy_bounces = min(3, max_bounces)
-        cycles.transmission_bounces = min(6, max_bounces)
-        cycles.volume_bounces = min(2, max_bounces)
+        cycles.diffuse_bounces = diffuse
+        cycles.glossy_bounces = glossy
+        cycles.transmission_bounces = transmission
+        cycles.volume_bounces = volume
 
 
-def configure_output(output_settings, output_path):
+def configure_output(scene, output_settings, output_path):
     """Configure output settings."""
-    scene = bpy.context.scene
+    render = scene.render
+    image_settings = render.image_settings
 
     # Resolution
-    scene.render.resolution_x = output_settings.get("width", 1024)
-    scene.render.resolution_y = output_settings.get("height", 1024)
-    scene.render.resolution_percentage = 100
+    render.resolution_x = output_settings.get("width", 1024)
+    render.resolution_y = output_settings.get("height", 1024)
+    render.resolution_percentage = 100
 
     # Format
     format_type = output_settings.get("format", "WEBP")
-    scene.render.image_settings.file_format = format_type
+    image_settings.file_format = format_type
 
+    # Formats other than WEBP keep the template quality
+    template_quality = _template_value('quality', image_settings.quality)
     if format_type == "WEBP":
-        scene.render.image_settings.quality = output_settings.get("quality", 90)
-    elif format_type == "PNG":
-        scene.render.image_settings.compression = 15
+        image_settings.quality = output_settings.get("quality", 90)
+    else:
+        image_settings.quality = template_quality
+        if format_type == "PNG":
+            image_settings.compression = 15
 
     # Transparent background
-    scene.render.film_transparent = output_settings.get("transparentBackground", False)
+    render.film_transparent = output_settings.get("transparentBackground", False)
 
     # Output path
-    scene.render.filepath = output_path
+    render.filepath = output_path
 
 
-def configure_lens_bloom(traits):
-    """Configure lens bloom/glare effect."""
-    bloom_type = traits.get("LensBloom", "Subtle")
-
-    bloom_settings = {
-        "None": {"enabled": False},
-        "Subtle": {"threshold": 0.9, "size": 3, "mix": 0},
-        "Moderate": {"threshold": 0.8, "size": 5, "mix": 0},
-        "Intense": {"threshold": 0.7, "size": 8, "mix": 0},
-        "Cinematic": {"threshold": 0.75, "size": 6, "mix": 0},
-    }
+def _get_glare_node(scene):
+    """Return the scene's compositor Glare node, scanning the tree only once."""
+    try:
+        return _GLARE_CACHE[scene.name]
+    except KeyError:
+        node = next((n for n in scene.node_tree.nodes if n.type == 'GLARE'), None)
+        _GLARE_CACHE[scene.name] = node
+        return node
 
-    settings = bloom_settings.get(bloom_type, bloom_settings["Subtle"])
 
-    if not settings.get("enabled", True):
-        return
+def configure_lens_bloom(scene, traits):
+    """Configure lens bloom/glare effect."""
+    bloom_type = traits.get("LensBloom", "Subtle")
+    settings = _BLOOM_SETTINGS.get(bloom_type, _BLOOM_SETTINGS["Subtle"])
+    enabled = settings.get("enabled", True)
 
     # Find glare node in compositor
-    scene = bpy.context.scene
     if not scene.use_nodes:
         return
 
-    for node in scene.node_tree.nodes:
-        if node.type == 'GLARE':
-            node.threshold = settings.get("threshold", 0.8)
-            node.size = settings.get("size", 7)
-            node.mix = settings.get("mix", 0)
+    node = _get_glare_node(scene)
+    if not node:
+        return
+
+    key = ('glare', node.name)
+    if enabled:
+        _template_value(key, (node.threshold, node.size, node.mix))
+        node.threshold = settings.get("threshold", 0.8)
+        node.size = settings.get("size", 7)
+        node.mix = settings.get("mix", 0)
+    elif key in _TEMPLATE_VALUES:
+        # Disabled bloom keeps the template glare an earlier token may have changed
+        node.threshold, node.size, node.mix = _TEMPLATE_VALUES[key]
 
 
-def apply_palette_temperature(traits):
+def apply_palette_temperature(scene, traits):
     """Apply color temperature adjustments."""
     temp = traits.get("PaletteTemperature", "Neutral")
+    settings = _TEMP_SETTINGS.get(temp, _TEMP_SETTINGS["Neutral"])
 
-    temp_settings = {
-        "Warm": {"exposure": 0.1, "gamma": (1.02, 1.0, 0.98)},
-        "Cool": {"exposure": 0.0, "gamma": (0.98, 1.0, 1.02)},
-        "Neutral": {"exposure": 0.0, "gamma": (1.0, 1.0, 1.0)},
-        "HighContrast": {"exposure": 0.05, "gamma": (1.0, 1.0, 1.0)},
-        "Desaturated": {"exposure": 0.0, "gamma": (1.0, 1.0, 1.0)},
-    }
+    scene.view_settings.exposure = settings["exposure"]
 
-    settings = temp_settings.get(temp, temp_settings["Neutral"])
 
-    scene = bpy.context.scene
-    scene.view_settings.exposure = settings["exposure"]
+def _silent(*_args):
+    """Stand-in for print when --quiet drops progress output."""
+
+
+# Progress output; --quiet swaps it for _silent so batches skip the per-token writes
+_log = print
 
 
 def render_token(recipe, output_path):
     """Main rendering function."""
-    print(f"Rendering token {recipe['tokenId']}...")
+    _log(f"Rendering token {recipe['tokenId']}...")
 
     # Initialize random seed
     seed_random(recipe['seed'])
 
     traits = recipe['traits']
     house_key = recipe['houseKey']
+    scene = bpy.context.scene
 
     # Configure scene
     configure_geometry(traits)
     configure_frame_material(traits)
     configure_core_material(traits)
     configure_lights(traits, house_key)
-    configure_atmosphere(traits)
-    configure_lens_bloom(traits)
-    apply_palette_temperature(traits)
+    # Atmosphere volumes are baked into each house template
+    configure_lens_bloom(scene, traits)
+    apply_palette_temperature(scene, traits)
 
     # Configure render
-    configure_render_settings(recipe['renderSettings'])
-    configure_output(recipe['output'], output_path)
+    configure_render_settings(scene, recipe['renderSettings'])
+    configure_output(scene, recipe['output'], output_path)
 
     # Render
-    print(f"  Starting render...")
+    _log("  Starting render...")
     bpy.ops.render.render(write_still=True)
 
-    print(f"  Saved to: {output_path}")
+    _log(f"  Saved to: {output_path}")
     return True
 
 
+def load_manifest(manifest_path):
+    """Load batch entries from a .jsonl file or a .manifest.json array."""
+    with open(manifest_path, 'rb') as f:
+        data = f.read()
+    loads = orjson.loads if orjson is not None else json.loads
+    if manifest_path.endswith('.jsonl'):
+        return [loads(line) for line in data.splitlines() if line.strip()]
+    return loads(data)
+
+
+def render_batch(entries, fresh_scene=False):
+    """Render manifest entries in this session, reusing the loaded template."""
+    # Entries without a template use the .blend given on the command line
+    default_template = bpy.data.filepath
+    failed = 0
+    for i, entry in enumerate(entries):
+        template = entry.get("template") or default_template
+        try:
+            if template and os.path.abspath(template) != os.path.abspath(bpy.data.filepath):
+                bpy.ops.wm.open_mainfile(filepath=template)
+            elif fresh_scene and i > 0 and bpy.data.filepath:
+                bpy.ops.wm.revert_mainfile()
+
+            recipe = load_recipe(entry["recipe"])
+            if not render_token(recipe, entry["output"]):
+                failed += 1
+        except Exception as e:
+            print(f"Error rendering {entry.get('recipe')}: {e}")
+            failed += 1
+
+    print(f"Rendered {len(entries) - failed}/{len(entries)} tokens")
+    return failed == 0
+
+
 def main():
     # Parse arguments after --
     argv = sys.argv
@@ -452,6 +664,18 @@ def main():
         print("Usage: blender -b <template.blend> -P render_token.py -- <recipe.json> <output_path>")
         sys.exit(1)
 
+    fresh_scene = "--fresh-scene" in argv
+    if "--quiet" in argv:
+        global _log
+        _log = _silent
+    argv = [arg for arg in argv if arg not in ("--fresh-scene", "--quiet")]
+
+    if argv and argv[0].endswith(('.jsonl', '.manifest.json')):
+        if not render_batch(load_manifest(argv[0]), fresh_scene):
+            sys.exit(1)
+        _log("Render complete!")
+        return
+
     if len(argv) < 2:
         print("Usage: blender -b <template.blend> -P render_token.py -- <recipe.json> <output_path>")
         sys.exit(1)
@@ -468,7 +692,7 @@ def main():
     if not success:
         sys.exit(1)
 
-    print("Render complete!")
+    _log("Render complete!")
 
 
 if __name__ == "__main__":